@@ -4,9 +4,14 @@ Configuration management for NQ Master v3
 
 import json
 import os
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 from typing import Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 @dataclass
 class Config:
     """Application configuration settings"""
@@ -22,6 +27,8 @@ class Config:
     
     # OCR Settings
     ocr_psm: str = "6"
+    fast_ocr: bool = False  # Green channel, 2x downsample and Otsu instead of adaptive threshold
+    ocr_opencl: bool = False  # Run the adaptive threshold on the GPU via OpenCL when available
     search_right_px: int = 520
     bbox: Dict[str, int] = None
     
@@ -38,7 +45,8 @@ class Config:
     # UI Settings
     window_width: int = 1400
     window_height: int = 900
-    auto_refresh_ms: int = 250
+    chart_refresh_ms: int = 100
+    max_redraw_rate: int = 30  # Price and history panel renders per second
     
     def __post_init__(self):
         if self.bbox is None:
@@ -49,9 +57,15 @@ class Config:
         """Load configuration from JSON file"""
         if os.path.exists(config_path):
             try:
-                with open(config_path, 'r') as f:
-                    data = json.load(f)
-                return cls(**data)
+                if orjson is not None:
+                    with open(config_path, 'rb') as f:
+                        data = orjson.loads(f.read())
+                else:
+                    with open(config_path, 'r') as f:
+                        data = json.load(f)
+                # Ignore settings that have since been retired
+                known = {field.name for field in fields(cls)}
+                return cls(**{key: value for key, value in data.items() if key in known})
             except Exception as e:
                 print(f"Error loading config: {e}")
         return cls()
@@ -59,8 +73,13 @@ class Config:
     def save(self, config_path: str = "config.json"):
         """Save configuration to JSON file"""
         try:
-            with open(config_path, 'w') as f:
-                json.dump(asdict(self), f, indent=2)
+            # orjson serializes the dataclass directly, without an asdict() copy
+            if orjson is not None:
+                with open(config_path, 'wb') as f:
+                    f.write(orjson.dumps(self, option=orjson.OPT_INDENT_2))
+            else:
+                with open(config_path, 'w') as f:
+                    json.dump(asdict(self), f, indent=2)
         except Exception as e:
             print(f"Error saving config: {e}")
     
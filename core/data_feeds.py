@@ -3,19 +3,35 @@ Data feed implementations for Yahoo Finance and OCR
 """
 
 import time
+import hashlib
 import threading
 import requests
 import numpy as np
 import pandas as pd
-import yfinance as yf
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from collections import OrderedDict
+from typing import Optional, Dict, Tuple
 
 # OCR imports
 import mss
 import cv2
 import pytesseract
 import re
+from PIL import Image
+
+# Prefer an in-process Tesseract API over spawning the CLI per call
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+# RE2 scans in linear time but has no lookaround, so digit boundaries
+# are matched as separators (or line edges) instead
+try:
+    import re2
+    PRICE_PATTERN = re2.compile(r"(?m)(?:^|\D)(\d{4,6}(?:\.\d{1,2})?)(?:\D|$)")
+except ImportError:
+    PRICE_PATTERN = re.compile(r"(?<!\d)(\d{4,6}(?:\.\d{1,2})?)(?!\d)")
 
 # Timezone
 try:
@@ -28,15 +44,35 @@ except ImportError:
 def now_et():
     return datetime.now(ET)
 
+def grab_bgra(sct, bbox: Dict[str, int]) -> np.ndarray:
+    """Grab a screen region as an HxWx4 BGRA view over mss' raw buffer (no copy)"""
+    shot = sct.grab(bbox)
+    return np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+
+def adaptive_threshold(gray: np.ndarray, use_opencl: bool = False) -> np.ndarray:
+    """Binarize a grayscale frame for OCR, optionally through OpenCV's OpenCL T-API"""
+    if use_opencl and cv2.ocl.haveOpenCL():
+        thresh = cv2.adaptiveThreshold(cv2.UMat(gray), 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY, 31, 2)
+        return thresh.get()
+    return cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY, 31, 2)
+
 class YahooFeed:
     """Yahoo Finance data feed"""
     
+    CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+    MAX_BACKOFF_SEC = 300
+    
     def __init__(self, config):
         self.config = config
         self._running = False
         self._stop_event = threading.Event()
         self.latest_data = None
         
+        # One keep-alive session reused across polls
+        self._session = requests.Session()
+        self._session.headers.update({"User-Agent": "Mozilla/5.0"})
+        self._backoff_sec = 0
+        
     def start(self):
         """Start the Yahoo feed"""
         if self._running:
@@ -59,26 +95,51 @@ class YahooFeed:
     
     def _feed_loop(self):
         """Main feed loop"""
+        next_tick = time.monotonic()
         while self._running and not self._stop_event.is_set():
             try:
                 self._fetch_data()
             except Exception as e:
                 print(f"Yahoo feed error: {e}")
             
-            self._stop_event.wait(self.config.yahoo_poll_sec)
+            # Sleep to a fixed deadline so fetch time doesn't stretch the period
+            next_tick = max(next_tick + max(self.config.yahoo_poll_sec, self._backoff_sec), time.monotonic())
+            self._stop_event.wait(max(0.0, next_tick - time.monotonic()))
     
     def _fetch_data(self):
         """Fetch data from Yahoo Finance"""
         try:
-            ticker = yf.Ticker(self.config.symbol)
-            data = ticker.history(period="1d", interval="1m", prepost=True)
+            response = self._session.get(
+                self.CHART_URL.format(symbol=self.config.symbol),
+                params={"interval": "1m", "range": "1d", "includePrePost": "true"},
+                timeout=10
+            )
             
-            if data.empty:
+            # Back off exponentially while rate-limited
+            if response.status_code == 429:
+                self._backoff_sec = min(max(self._backoff_sec * 2, self.config.yahoo_poll_sec * 2), self.MAX_BACKOFF_SEC)
+                print(f"Yahoo rate limit hit, backing off {self._backoff_sec}s")
                 return
             
-            # Clean and format data
-            data = data.rename(columns=str.title)[["Open", "High", "Low", "Close", "Volume"]]
-            data.index = data.index.tz_convert(ET)
+            response.raise_for_status()
+            self._backoff_sec = 0
+            
+            result = response.json()["chart"]["result"][0]
+            timestamps = result.get("timestamp")
+            if not timestamps:
+                return
+            
+            # Missing values arrive as null and become NaN
+            quote = result["indicators"]["quote"][0]
+            index = pd.to_datetime(np.asarray(timestamps, dtype=np.int64), unit="s", utc=True).tz_convert(ET)
+            data = pd.DataFrame({
+                "Open": np.asarray(quote["open"], dtype=np.float64),
+                "High": np.asarray(quote["high"], dtype=np.float64),
+                "Low": np.asarray(quote["low"], dtype=np.float64),
+                "Close": np.asarray(quote["close"], dtype=np.float64),
+                "Volume": np.asarray(quote["volume"], dtype=np.float64),
+            }, index=index)
+            data = data.dropna(subset=["Close"])
             
             # Filter to current trading day
             today = now_et().date()
@@ -89,83 +150,156 @@ class YahooFeed:
         except Exception as e:
             print(f"Error fetching Yahoo data: {e}")
 
+class TesseractReader:
+    """Word-level Tesseract OCR, kept loaded in-process when tesserocr is available"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._api = None
+        
+        if tesserocr is not None:
+            try:
+                self._api = tesserocr.PyTessBaseAPI()
+            except RuntimeError as e:
+                print(f"tesserocr unavailable, using pytesseract: {e}")
+    
+    def image_to_data(self, img: np.ndarray, psm: str = "6") -> Dict[str, list]:
+        """Return word text and boxes in pytesseract's image_to_data DICT layout"""
+        if self._api is None:
+            return pytesseract.image_to_data(img, output_type=pytesseract.Output.DICT, config=f"--psm {psm}")
+        
+        data = {"text": [], "left": [], "top": [], "width": [], "height": []}
+        
+        # PyTessBaseAPI is not thread-safe
+        with self._lock:
+            self._api.SetPageSegMode(int(psm))
+            self._api.SetImage(Image.fromarray(img))
+            self._api.Recognize()
+            
+            level = tesserocr.RIL.WORD
+            for word in tesserocr.iterate_level(self._api.GetIterator(), level):
+                text = word.GetUTF8Text(level)
+                box = word.BoundingBox(level)
+                if not text or box is None:
+                    continue
+                
+                x1, y1, x2, y2 = box
+                data["text"].append(text)
+                data["left"].append(x1)
+                data["top"].append(y1)
+                data["width"].append(x2 - x1)
+                data["height"].append(y2 - y1)
+        
+        return data
+
 class DOMLocator:
     """Auto-locator for TopstepX DOM price column"""
     
     PRICE_WORDS = {"PRICE", "PR1CE", "PRlCE", "PRlC", "RICE"}
+    DIGIT_PATTERN = re.compile(r"\d")
     
-    def __init__(self, config):
+    def __init__(self, config, reader: Optional[TesseractReader] = None):
         self.config = config
+        self.reader = reader or TesseractReader()
+        
+        # Coarse thumbnail of the last successfully located strip
+        self._last_phash = None
+        self._last_bbox = None
     
-    def auto_locate(self) -> Optional[Dict[str, int]]:
-        """Automatically locate the price column in DOM"""
+    def auto_locate(self, sct=None) -> Optional[Dict[str, int]]:
+        """Automatically locate the price column in DOM
+        
+        ``sct`` is an open mss grabber owned by the calling thread; a
+        temporary one is opened when it is not given.
+        """
         try:
-            with mss.mss() as sct:
-                # Capture right side of screen where DOM typically appears
-                monitor = sct.monitors[1]
-                scan_width = min(self.config.search_right_px, monitor["width"])
-                
-                bbox = {
-                    "left": monitor["left"] + monitor["width"] - scan_width,
-                    "top": monitor["top"] + 50,
-                    "width": scan_width,
-                    "height": monitor["height"] - 100
-                }
-                
-                img = np.array(sct.grab(bbox))
-            
-            # Process image for OCR
-            gray = cv2.cvtColor(img, cv2.COLOR_BGRA2GRAY)
-            thresh = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY, 31, 2)
+            if sct is None:
+                with mss.mss() as temp_sct:
+                    return self._locate(temp_sct)
+            return self._locate(sct)
             
-            # Run OCR to find text
-            data = pytesseract.image_to_data(thresh, output_type=pytesseract.Output.DICT, config="--psm 6")
+        except Exception as e:
+            print(f"Auto-locate error: {e}")
+            return None
+    
+    def _locate(self, sct) -> Optional[Dict[str, int]]:
+        """Capture the right side of the screen and search it for the DOM"""
+        # Capture right side of screen where DOM typically appears
+        monitor = sct.monitors[1]
+        scan_width = min(self.config.search_right_px, monitor["width"])
+        
+        bbox = {
+            "left": monitor["left"] + monitor["width"] - scan_width,
+            "top": monitor["top"] + 50,
+            "width": scan_width,
+            "height": monitor["height"] - 100
+        }
+        
+        img = grab_bgra(sct, bbox)
+        
+        # Process image for OCR
+        gray = cv2.cvtColor(img, cv2.COLOR_BGRA2GRAY)
+        
+        # Layout unchanged since the last hit, skip OCR
+        phash = (tuple(bbox.values()), cv2.resize(gray, (16, 16), interpolation=cv2.INTER_AREA).tobytes())
+        if phash == self._last_phash:
+            return self._last_bbox
+        
+        thresh = adaptive_threshold(gray, self.config.ocr_opencl)
+        
+        # Run OCR to find text
+        data = self.reader.image_to_data(thresh, psm="6")
+        result_bbox = self._find_price_column(data, bbox)
+        
+        if result_bbox:
+            self._last_phash = phash
+            self._last_bbox = result_bbox
+        return result_bbox
+    
+    def _find_price_column(self, data: Dict[str, list], bbox: Dict[str, int]) -> Optional[Dict[str, int]]:
+        """Derive the OCR bbox from word boxes found in the scanned strip"""
+        # Look for "PRICE" header
+        for i, text in enumerate(data["text"]):
+            if not text:
+                continue
             
-            # Look for "PRICE" header
-            for i, text in enumerate(data["text"]):
-                if not text:
-                    continue
+            text_upper = text.strip().upper()
+            if text_upper in self.PRICE_WORDS:
+                # Found price header, create bbox below it
+                x, y, w, h = data["left"][i], data["top"][i], data["width"][i], data["height"][i]
                 
-                text_upper = text.strip().upper()
-                if text_upper in self.PRICE_WORDS:
-                    # Found price header, create bbox below it
-                    x, y, w, h = data["left"][i], data["top"][i], data["width"][i], data["height"][i]
-                    
-                    result_bbox = {
-                        "left": max(0, bbox["left"] + x - 12),
-                        "top": max(0, bbox["top"] + y + h + 6),
-                        "width": 220,
-                        "height": 880
-                    }
-                    return result_bbox
-            
-            # Fallback: look for numeric columns
-            x_positions = []
-            for i, text in enumerate(data["text"]):
-                if text and re.search(r'\d', text.strip()):
-                    x_positions.append(data["left"][i])
-            
-            if x_positions:
-                # Use median x position of numeric text
-                median_x = int(np.median(x_positions))
                 result_bbox = {
-                    "left": max(0, bbox["left"] + median_x - 40),
-                    "top": bbox["top"] + 60,
+                    "left": max(0, bbox["left"] + x - 12),
+                    "top": max(0, bbox["top"] + y + h + 6),
                     "width": 220,
-                    "height": bbox["height"] - 120
+                    "height": 880
                 }
                 return result_bbox
-            
-            return None
-            
-        except Exception as e:
-            print(f"Auto-locate error: {e}")
-            return None
+        
+        # Fallback: look for numeric columns
+        texts = data["text"]
+        has_digit = np.fromiter((bool(text) and self.DIGIT_PATTERN.search(text) is not None for text in texts),
+                                dtype=bool, count=len(texts))
+        x_positions = np.asarray(data["left"], dtype=np.int32)[has_digit]
+        
+        if x_positions.size:
+            # Use median x position of numeric text
+            median_x = int(np.median(x_positions))
+            result_bbox = {
+                "left": max(0, bbox["left"] + median_x - 40),
+                "top": bbox["top"] + 60,
+                "width": 220,
+                "height": bbox["height"] - 120
+            }
+            return result_bbox
+        
+        return None
 
 class OCRFeed:
     """OCR-based price feed from DOM"""
     
-    PRICE_PATTERN = re.compile(r"(?<!\d)(\d{4,6}(?:\.\d{1,2})?)(?!\d)")
+    PRICE_PATTERN = PRICE_PATTERN
+    OCR_CACHE_SIZE = 64
     
     def __init__(self, config):
         self.config = config
@@ -177,8 +311,17 @@ class OCRFeed:
         self.last_good_price = None
         self.last_ocr_time = None
         
-        self.locator = DOMLocator(config)
+        self.reader = TesseractReader()
+        self.locator = DOMLocator(config, self.reader)
         self.last_auto_locate = 0
+        
+        # Screen grabber owned by the OCR thread
+        self._sct = None
+        
+        # OCR result cache keyed by OCR settings and frame hash (LRU)
+        self._ocr_cache: "OrderedDict[Tuple, Optional[float]]" = OrderedDict()
+        self._last_frame_hash = None
+        self._last_frame_price = None
     
     def start(self):
         """Start the OCR feed"""
@@ -207,7 +350,9 @@ class OCRFeed:
     def auto_locate(self):
         """Trigger auto-location of DOM"""
         try:
-            new_bbox = self.locator.auto_locate()
+            # mss grabbers are per-thread; other threads get a temporary one
+            on_ocr_thread = threading.current_thread() is getattr(self, "ocr_thread", None)
+            new_bbox = self.locator.auto_locate(self._sct if on_ocr_thread else None)
             if new_bbox:
                 self.set_bbox(new_bbox)
                 print(f"Auto-located DOM at: {new_bbox}")
@@ -216,68 +361,69 @@ class OCRFeed:
     
     def _ocr_loop(self):
         """Main OCR processing loop"""
-        # Try auto-locate on startup
-        self.auto_locate()
-        
-        while self._running and not self._stop_event.is_set():
-            try:
-                # Periodic auto-locate
-                current_time = time.time()
-                if current_time - self.last_auto_locate > 30:  # Every 30 seconds
-                    if not self.last_ocr_time or (current_time - self.last_ocr_time) > 3:
-                        self.auto_locate()
-                    self.last_auto_locate = current_time
-                
-                # Capture and process
-                price = self._capture_price()
-                if price is not None:
-                    self.latest_price = price
-                    self.last_ocr_time = current_time
-                
-            except Exception as e:
-                print(f"OCR loop error: {e}")
+        self._sct = mss.mss()
+        try:
+            # Try auto-locate on startup
+            self.auto_locate()
             
-            self._stop_event.wait(self.config.ocr_poll_sec)
+            next_tick = time.monotonic()
+            while self._running and not self._stop_event.is_set():
+                try:
+                    # Periodic auto-locate
+                    current_time = time.time()
+                    if current_time - self.last_auto_locate > 30:  # Every 30 seconds
+                        if not self.last_ocr_time or (current_time - self.last_ocr_time) > 3:
+                            self.auto_locate()
+                        self.last_auto_locate = current_time
+                    
+                    # Capture and process
+                    price = self._capture_price()
+                    if price is not None:
+                        self.latest_price = price
+                        self.last_ocr_time = current_time
+                    
+                except Exception as e:
+                    print(f"OCR loop error: {e}")
+                
+                # Sleep to a fixed deadline so OCR time doesn't stretch the period
+                next_tick = max(next_tick + self.config.ocr_poll_sec, time.monotonic())
+                self._stop_event.wait(max(0.0, next_tick - time.monotonic()))
+        finally:
+            self._sct.close()
+            self._sct = None
     
     def _capture_price(self) -> Optional[float]:
         """Capture and extract price from DOM"""
         try:
             # Screen capture
-            with mss.mss() as sct:
-                img = np.array(sct.grab(self.bbox))
+            img = grab_bgra(self._sct, self.bbox)
             
             # Process image
-            gray = cv2.cvtColor(img, cv2.COLOR_BGRA2GRAY)
-            thresh = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY, 31, 2)
+            if self.config.fast_ocr:
+                # DOM text is near-monochrome, so one channel stands in for luma
+                gray = np.ascontiguousarray(img[..., 1])
+            else:
+                gray = cv2.cvtColor(img, cv2.COLOR_BGRA2GRAY)
             
-            # OCR
-            data = pytesseract.image_to_data(thresh, output_type=pytesseract.Output.DICT, config=f"--psm {self.config.ocr_psm}")
+            # Skip OCR entirely for frames we have already read with the same settings
+            frame_hash = (self._ocr_settings(), hashlib.blake2b(gray, digest_size=8).digest())
+            if frame_hash == self._last_frame_hash:
+                median_price = self._last_frame_price
+            elif frame_hash in self._ocr_cache:
+                self._ocr_cache.move_to_end(frame_hash)
+                median_price = self._ocr_cache[frame_hash]
+            else:
+                median_price = self._ocr_price(gray)
+                self._ocr_cache[frame_hash] = median_price
+                if len(self._ocr_cache) > self.OCR_CACHE_SIZE:
+                    self._ocr_cache.popitem(last=False)
             
-            # Extract prices
-            prices = []
-            for text in data["text"]:
-                if not text:
-                    continue
-                
-                clean_text = text.strip().replace(",", "")
-                match = self.PRICE_PATTERN.search(clean_text)
-                
-                if match:
-                    try:
-                        price = float(match.group(1))
-                        if self.config.min_px <= price <= self.config.max_px:
-                            # Snap to NQ tick size (0.25)
-                            price = round(price * 4) / 4
-                            prices.append(price)
-                    except ValueError:
-                        continue
+            self._last_frame_hash = frame_hash
+            self._last_frame_price = median_price
             
-            if not prices:
+            if median_price is None:
                 return None
             
-            # Use median price to filter outliers
-            median_price = float(np.median(prices))
-            
             # Sanity check against last known good price
             if self.last_good_price is not None:
                 if abs(median_price - self.last_good_price) > self.config.max_jump_pts:
@@ -288,4 +434,37 @@ class OCRFeed:
             
         except Exception as e:
             print(f"OCR capture error: {e}")
-            return None
\ No newline at end of file
+            return None
+    
+    def _ocr_settings(self) -> Tuple:
+        """Config values that change what _ocr_price reads from the same frame"""
+        config = self.config
+        return (config.fast_ocr, config.ocr_psm, config.ocr_opencl, config.min_px, config.max_px)
+    
+    def _ocr_price(self, gray: np.ndarray) -> Optional[float]:
+        """Run OCR on a grayscale frame and return the median price"""
+        if self.config.fast_ocr:
+            small = cv2.resize(gray, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
+            _, thresh = cv2.threshold(small, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+        else:
+            thresh = adaptive_threshold(gray, self.config.ocr_opencl)
+        
+        # OCR
+        data = self.reader.image_to_data(thresh, psm=self.config.ocr_psm)
+        
+        # Extract prices in one pass over the joined OCR words
+        joined = "\n".join(data["text"]).replace(",", "")
+        matches = self.PRICE_PATTERN.findall(joined)
+        if not matches:
+            return None
+        
+        prices = np.fromiter(map(float, matches), dtype=np.float64, count=len(matches))
+        prices = prices[(prices >= self.config.min_px) & (prices <= self.config.max_px)]
+        if prices.size == 0:
+            return None
+        
+        # Snap to NQ tick size (0.25)
+        prices = np.round(prices * 4) / 4
+        
+        # Use median price to filter outliers
+        return float(np.median(prices))
\ No newline at end of file
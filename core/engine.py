@@ -33,7 +33,7 @@ class TradingEngine(QObject):
     price_updated = pyqtSignal(float, str)  # price, source
     signal_updated = pyqtSignal(str, int, list)  # bias, confidence, reasons
     confluence_updated = pyqtSignal(int, list)  # score, reasons
-    news_updated = pyqtSignal(list)  # news items
+    news_updated = pyqtSignal(tuple)  # news items
     error_occurred = pyqtSignal(str)  # error message
     
     def __init__(self, config):
@@ -42,10 +42,13 @@ class TradingEngine(QObject):
         self._running = False
         self._stop_event = threading.Event()
         
-        # Core data
+        # Core data, guarded by _state_lock while a processing cycle runs
+        self._state_lock = threading.RLock()
         self.df = pd.DataFrame(columns=["Open", "High", "Low", "Close", "Volume"])
+        self._df_version = 0  # Bumped on every write to self.df; keys the indicator cache
         self.current_price = 0.0
         self.current_source = "YAHOO"
+        self._last_yahoo_data = None
         
         # Initialize components
         self.yahoo_feed = YahooFeed(config)
@@ -58,10 +61,29 @@ class TradingEngine(QObject):
         self.or_high = None
         self.or_low = None
         self.or_ready = False
+        self._or_window_key = None
+        self._or_window = None
+        self._or_last_bar = None
+        self._or_frozen = False
         
         # Signal tracking for chimes
         self.last_bias = None
         
+        # Payloads of the latest cycle and the last emitted ones; UI signals fire only on change
+        self._price_payload = None
+        self._signal_payload = None
+        self._confluence_payload = None
+        self._last_price_payload = None
+        self._last_signal_payload = None
+        self._last_confluence_payload = None
+        
+        # Panel snapshot published by the processing thread after each cycle
+        self._snapshot: Optional[Dict] = None
+        
+        # News arrives on the feed's own thread; forward changes and failures to the UI
+        self.news_feed.on_update = self.news_updated.emit
+        self.news_feed.on_error = self.error_occurred.emit
+        
     def start(self):
         """Start the trading engine"""
         if self._running:
@@ -106,14 +128,17 @@ class TradingEngine(QObject):
             }
         
         # Get latest indicators
-        indicators_df = self.indicator_engine.compute_indicators(self.df)
+        indicators_df = self.get_indicators()
         if indicators_df.empty:
             return {"price": self.current_price, "source": self.current_source}
         
-        latest_row = indicators_df.iloc[-1]
-        
         # Get current signal
-        bias, confidence, reasons = self.signal_engine.generate_signal(indicators_df)
+        return self._current_data(indicators_df, self.signal_engine.generate_signal(indicators_df))
+    
+    def _current_data(self, indicators_df: pd.DataFrame, signal: Tuple[str, int, List[str]]) -> Dict:
+        """Build the get_current_data snapshot from indicators and an already computed signal"""
+        bias, confidence, reasons = signal
+        latest_row = indicators_df.iloc[-1]
         
         return {
             "price": self.current_price,
@@ -140,10 +165,56 @@ class TradingEngine(QObject):
         if self.df.empty:
             return 50, ["No data available"]
         
-        indicators_df = self.indicator_engine.compute_indicators(self.df)
+        indicators_df = self.get_indicators()
         return self.signal_engine.confluence_analysis(indicators_df, self.or_high, self.or_low, self.or_ready)
     
-    def get_news_data(self) -> List[Dict]:
+    def get_snapshot(self) -> Dict:
+        """Get everything the panels display, from one consistent engine state
+        
+        While the engine runs this is the snapshot its processing thread
+        published after the last cycle, so the UI thread neither computes
+        indicators nor waits on the state lock.
+        """
+        snapshot = self._snapshot if self._running else None
+        if snapshot is None:
+            with self._state_lock:
+                snapshot = self._build_snapshot()
+        
+        return {
+            **snapshot,
+            "news": self.get_news_data(),
+            "news_sentiment": self.news_feed.get_market_sentiment(),
+        }
+    
+    def _build_snapshot(self, signal: Optional[Tuple[str, int, List[str]]] = None,
+                        confluence: Optional[Tuple[int, List[str]]] = None) -> Dict:
+        """Collect the engine-side panel data; call with _state_lock held
+        
+        The processing loop passes the signal and confluence payloads it just
+        computed, so the snapshot shows exactly what was emitted; anything not
+        passed is computed here.
+        """
+        if signal is None:
+            snapshot = self.get_current_data()
+        else:
+            snapshot = self._current_data(self.get_indicators(), signal)
+        if confluence is None:
+            confluence = self.get_confluence_analysis()
+        snapshot["confluence_score"], snapshot["confluence_reasons"] = confluence
+        
+        # Trailing bars of the state the signals above were computed from, for the chart
+        snapshot["indicator_buffers"] = self.get_indicator_buffers()
+        return snapshot
+    
+    def get_indicators(self) -> pd.DataFrame:
+        """Get indicators for the session, updated incrementally from the last call"""
+        return self.indicator_engine.update_indicators(self.df, self._df_version)
+    
+    def get_indicator_buffers(self, n: int = 100) -> Dict[str, np.ndarray]:
+        """Get the last n bars and their indicators as arrays of the incremental kernel state"""
+        return self.indicator_engine.tail(self.get_indicators(), n)
+    
+    def get_news_data(self) -> Tuple[Dict, ...]:
         """Get current news data"""
         return self.news_feed.get_news_items()
     
@@ -159,27 +230,38 @@ class TradingEngine(QObject):
     
     def _processing_loop(self):
         """Main processing loop"""
+        next_tick = time.monotonic()
         while self._running and not self._stop_event.is_set():
             try:
-                self._update_data()
-                self._compute_signals()
-                self._update_opening_range()
+                with self._state_lock:
+                    self._update_data()
+                    self._compute_signals()
+                    self._update_opening_range()
+                    self._compute_confluence()
+                    self._snapshot = self._build_snapshot(self._signal_payload, self._confluence_payload)
+                
+                # Notify only once the snapshot the panels will read is published
+                self._emit_updates()
                 
             except Exception as e:
                 self.error_occurred.emit(f"Processing error: {e}")
             
-            # Wait for next cycle
-            self._stop_event.wait(self.config.ocr_poll_sec)
+            # Wait for next cycle, measured from the previous deadline
+            next_tick = max(next_tick + self.config.ocr_poll_sec, time.monotonic())
+            self._stop_event.wait(max(0.0, next_tick - time.monotonic()))
     
     def _update_data(self):
         """Update price data from feeds"""
         # Get Yahoo data
         yahoo_data = self.yahoo_feed.get_latest_data()
-        if yahoo_data is not None and not yahoo_data.empty:
-            # Update main dataframe
-            for timestamp, row in yahoo_data.iterrows():
-                self.df.loc[timestamp] = row
-            self.df.sort_index(inplace=True)
+        if yahoo_data is not None and not yahoo_data.empty and yahoo_data is not self._last_yahoo_data:
+            # Merge new Yahoo bars over the main dataframe in one step
+            if self.df.empty:
+                self.df = yahoo_data.copy()
+            else:
+                self.df = yahoo_data.combine_first(self.df)
+            self._df_version += 1
+            self._last_yahoo_data = yahoo_data
         
         # Get OCR price
         ocr_price = self.ocr_feed.get_latest_price()
@@ -197,8 +279,7 @@ class TradingEngine(QObject):
                 self.current_price = float(self.df.iloc[-1]["Close"])
                 self.current_source = "YAHOO"
         
-        # Emit price update
-        self.price_updated.emit(self.current_price, self.current_source)
+        self._price_payload = (self.current_price, self.current_source)
     
     def _splice_ocr_price(self, ocr_price: float):
         """Splice OCR price into current minute bar"""
@@ -209,12 +290,14 @@ class TradingEngine(QObject):
         current_time = now_et().replace(second=0, microsecond=0)
         
         if current_time in self.df.index:
-            # Update existing bar
-            bar = self.df.loc[current_time].copy()
-            bar["Close"] = ocr_price
-            bar["High"] = max(bar["High"], ocr_price)
-            bar["Low"] = min(bar["Low"], ocr_price)
-            self.df.loc[current_time] = bar
+            # Update existing bar in place; High/Low can only move if Close does
+            if self.df.at[current_time, "Close"] == ocr_price:
+                return
+            self.df.at[current_time, "Close"] = ocr_price
+            if ocr_price > self.df.at[current_time, "High"]:
+                self.df.at[current_time, "High"] = ocr_price
+            if ocr_price < self.df.at[current_time, "Low"]:
+                self.df.at[current_time, "Low"] = ocr_price
         else:
             # Create new bar
             prev_close = float(self.df.iloc[-1]["Close"]) if not self.df.empty else ocr_price
@@ -225,8 +308,13 @@ class TradingEngine(QObject):
                 "Close": ocr_price,
                 "Volume": 0
             }
+            # Bars normally arrive in order, so appending keeps the index sorted
+            out_of_order = current_time < self.df.index[-1]
             self.df.loc[current_time] = new_bar
-            self.df.sort_index(inplace=True)
+            if out_of_order:
+                self.df.sort_index(inplace=True)
+        
+        self._df_version += 1
     
     def _compute_signals(self):
         """Compute and emit trading signals"""
@@ -234,7 +322,7 @@ class TradingEngine(QObject):
             return
         
         # Compute indicators
-        indicators_df = self.indicator_engine.compute_indicators(self.df)
+        indicators_df = self.get_indicators()
         if indicators_df.empty:
             return
         
@@ -246,30 +334,73 @@ class TradingEngine(QObject):
             self.last_bias = bias
             # Could emit a chime signal here
         
-        # Emit signal update
-        self.signal_updated.emit(bias, confidence, reasons)
+        self._signal_payload = (bias, confidence, reasons)
+    
+    def _compute_confluence(self):
+        """Compute confluence analysis; runs after the opening range update it depends on"""
+        if self.df.empty:
+            return
+        
+        indicators_df = self.get_indicators()
+        if indicators_df.empty:
+            return
         
-        # Generate confluence analysis
-        conf_score, conf_reasons = self.signal_engine.confluence_analysis(
+        self._confluence_payload = self.signal_engine.confluence_analysis(
             indicators_df, self.or_high, self.or_low, self.or_ready
         )
+    
+    def _emit_updates(self):
+        """Emit the price, signal and confluence payloads that changed since last emitted"""
+        if self._price_payload is not None and self._price_payload != self._last_price_payload:
+            self._last_price_payload = self._price_payload
+            self.price_updated.emit(*self._price_payload)
+        
+        if self._signal_payload is not None and self._signal_payload != self._last_signal_payload:
+            self._last_signal_payload = self._signal_payload
+            self.signal_updated.emit(*self._signal_payload)
         
-        # Emit confluence update
-        self.confluence_updated.emit(conf_score, conf_reasons)
+        if self._confluence_payload is not None and self._confluence_payload != self._last_confluence_payload:
+            self._last_confluence_payload = self._confluence_payload
+            self.confluence_updated.emit(*self._confluence_payload)
     
     def _update_opening_range(self):
         """Update opening range calculations"""
         if self.df.empty:
             return
         
-        # Define opening range period (9:30 AM - 9:30 AM + or_minutes)
-        market_open = now_et().replace(hour=9, minute=30, second=0, microsecond=0)
-        or_end = market_open + timedelta(minutes=self.config.or_minutes)
+        # Define opening range period (9:30 AM - 9:30 AM + or_minutes), once per session
+        now = now_et()
+        window_key = (now.date(), self.config.or_minutes)
+        if self._or_window_key != window_key:
+            market_open = now.replace(hour=9, minute=30, second=0, microsecond=0)
+            self._or_window = (market_open, market_open + timedelta(minutes=self.config.or_minutes))
+            self._or_window_key = window_key
+            self._or_last_bar = None
+            self._or_frozen = False
+        
+        # The range is final once the window has closed
+        if self._or_frozen:
+            return
         
-        # Get opening range data
-        or_data = self.df.loc[(self.df.index >= market_open) & (self.df.index <= or_end)]
+        market_open, or_end = self._or_window
         
-        if not or_data.empty:
+        if self._or_last_bar is None or now >= or_end:
+            # Full pass over the window to seed the range, and once more to settle it at the close
+            or_data = self.df.loc[(self.df.index >= market_open) & (self.df.index <= or_end)]
+            if or_data.empty:
+                return
+            
             self.or_high = float(or_data["High"].max())
             self.or_low = float(or_data["Low"].min())
-            self.or_ready = now_et() >= or_end
\ No newline at end of file
+            self.or_ready = now >= or_end
+            self._or_frozen = self.or_ready
+        else:
+            # Fold in bars since the last update (including the last one, which may have been spliced)
+            or_data = self.df.loc[self._or_last_bar:or_end]
+            if or_data.empty:
+                return
+            
+            self.or_high = max(self.or_high, float(or_data["High"].max()))
+            self.or_low = min(self.or_low, float(or_data["Low"].min()))
+        
+        self._or_last_bar = or_data.index[-1]
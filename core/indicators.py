@@ -2,108 +2,155 @@
 Technical indicators calculation engine
 """
 
+import threading
 import numpy as np
 import pandas as pd
-from typing import Tuple
+from typing import Dict, Optional, Tuple
+
+from .kernels import compute_all, OUTPUT_COLUMNS, N_INDICATORS
+
+INDICATOR_COLUMNS = OUTPUT_COLUMNS[:N_INDICATORS]
+
+def first_changed_row(old_index: pd.Index, old_values: np.ndarray,
+                      index: pd.Index, values: np.ndarray) -> int:
+    """Return the first row where (index, values) differs from an earlier snapshot
+    
+    values hold one row per field and one column per bar; NaN matches NaN.
+    Returns the length of the shared prefix when nothing in it changed.
+    """
+    common = min(len(index), len(old_index))
+    if not index[:common].equals(old_index[:common]):
+        return 0
+    
+    old = old_values[:, :common]
+    new = values[:, :common]
+    changed = ~((old == new) | (np.isnan(old) & np.isnan(new))).all(axis=0)
+    if changed.any():
+        return int(changed.argmax())
+    return common
 
 class IndicatorEngine:
     """Calculate technical indicators for trading signals"""
     
     def __init__(self, config):
         self.config = config
+        
+        # Incremental state for update_indicators
+        self._lock = threading.Lock()
+        self._index: Optional[pd.Index] = None
+        self._prices: Optional[np.ndarray] = None
+        self._volume: Optional[np.ndarray] = None
+        self._sessions: Optional[np.ndarray] = None
+        self._outputs: Optional[np.ndarray] = None
+        self._result: Optional[pd.DataFrame] = None
+        self._version: Optional[int] = None
     
     def compute_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         """Compute all technical indicators"""
         if df.empty or len(df) < 50:  # Need minimum bars for indicators
             return df.copy()
         
-        result = df.copy()
-        
-        # Exponential Moving Averages
-        result["EMA9"] = self._ema(result["Close"], 9)
-        result["EMA21"] = self._ema(result["Close"], 21)
-        result["EMA50"] = self._ema(result["Close"], 50)
-        
-        # MACD
-        macd_line, macd_signal, macd_hist = self._macd(result["Close"])
-        result["MACD"] = macd_line
-        result["MACDsig"] = macd_signal
-        result["MACDhist"] = macd_hist
-        
-        # RSI
-        result["RSI14"] = self._rsi(result["Close"], 14)
-        
-        # Stochastic
-        result["StochK"] = self._stochastic_k(result["High"], result["Low"], result["Close"])
-        result["StochD"] = result["StochK"].rolling(3).mean()
-        
-        # Bollinger Bands
-        bb_mid, bb_upper, bb_lower = self._bollinger_bands(result["Close"])
-        result["BBmid"] = bb_mid
-        result["BBup"] = bb_upper
-        result["BBlo"] = bb_lower
-        
-        # VWAP (session-based)
-        result["VWAP"] = self._session_vwap(result)
+        prices, volume = self._input_arrays(df)
+        outputs = np.empty((len(OUTPUT_COLUMNS), len(df)))
+        compute_all(outputs, prices[0], prices[1], prices[2], volume, self._session_keys(df.index), 0)
         
-        return result
+        return self._build_frame(df, outputs)
     
-    def _ema(self, series: pd.Series, span: int) -> pd.Series:
-        """Exponential Moving Average"""
-        return series.ewm(span=span, adjust=False).mean()
-    
-    def _rsi(self, series: pd.Series, length: int = 14) -> pd.Series:
-        """Relative Strength Index"""
-        delta = series.diff()
-        up = delta.clip(lower=0).rolling(length).mean()
-        down = (-delta.clip(upper=0)).rolling(length).mean()
+    def update_indicators(self, df: pd.DataFrame, version: Optional[int] = None) -> pd.DataFrame:
+        """Compute indicators for a growing series, recomputing only changed rows
+        
+        Rows that match the previous call are reused, so splicing the last bar
+        or appending a new one costs O(1) kernel work and session-key
+        normalization. Reading, comparing and copying the input and output
+        columns, and assembling the returned frame, stay O(N) vectorized
+        passes. version is a counter the caller bumps on every write to df; a
+        repeated version returns the cached result without comparing rows.
+        The returned frame is shared between calls and must not be modified.
+        """
+        if df.empty or len(df) < 50:
+            return df.copy()
         
-        rs = up / down.replace(0, np.nan)
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
+        with self._lock:
+            # Cheap check first: nothing has written to the frame since the last call
+            if version is not None and version == self._version:
+                return self._result
+            
+            prices, volume = self._input_arrays(df)
+            start = self._first_changed_row(df.index, prices, volume)
+            
+            if start == len(df) and len(df) == len(self._index):
+                self._version = version
+                return self._result
+            
+            # Session keys of unchanged rows are reused; only the tail is normalized
+            sessions = np.empty(len(df), dtype=np.int64)
+            if start > 0:
+                sessions[:start] = self._sessions[:start]
+            sessions[start:] = self._session_keys(df.index[start:])
+            
+            outputs = np.empty((len(OUTPUT_COLUMNS), len(df)))
+            if start > 0:
+                outputs[:, :start] = self._outputs[:, :start]
+            compute_all(outputs, prices[0], prices[1], prices[2], volume, sessions, start)
+            
+            self._index = df.index
+            self._prices = prices
+            self._volume = volume
+            self._sessions = sessions
+            self._outputs = outputs
+            self._result = self._build_frame(df, outputs)
+            self._version = version
+            return self._result
     
-    def _stochastic_k(self, high: pd.Series, low: pd.Series, close: pd.Series, k: int = 14) -> pd.Series:
-        """Stochastic %K"""
-        lowest_low = low.rolling(k).min()
-        highest_high = high.rolling(k).max()
-        
-        k_percent = 100 * (close - lowest_low) / (highest_high - lowest_low).replace(0, np.nan)
-        return k_percent
+    def tail(self, df: pd.DataFrame, n: int) -> Dict[str, np.ndarray]:
+        """Last n bars of df as index, Close and indicator arrays, straight from the kernel state
+        
+        Call after update_indicators(df). The arrays are views of buffers that
+        are replaced, never rewritten, on the next change, so callers can keep
+        them without copying. Indicators are left out while df is too short.
+        """
+        with self._lock:
+            current = (len(df) >= 50 and self._index is not None and len(self._index) == len(df)
+                       and self._index[-1] == df.index[-1])
+            if not current:
+                return {"index": df.index[-n:], "Close": df["Close"].to_numpy(dtype=np.float64)[-n:]}
+            
+            buffers = {col: self._outputs[i, -n:] for i, col in enumerate(INDICATOR_COLUMNS)}
+            buffers["index"] = self._index[-n:]
+            buffers["Close"] = self._prices[2, -n:]
+            return buffers
     
-    def _macd(self, series: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[pd.Series, pd.Series, pd.Series]:
-        """MACD indicator"""
-        ema_fast = self._ema(series, fast)
-        ema_slow = self._ema(series, slow)
-        
-        macd_line = ema_fast - ema_slow
-        macd_signal = self._ema(macd_line, signal)
-        macd_histogram = macd_line - macd_signal
-        
-        return macd_line, macd_signal, macd_histogram
+    def _first_changed_row(self, index: pd.Index, prices: np.ndarray, volume: np.ndarray) -> int:
+        """Return the first row that differs from the cached inputs"""
+        if self._index is None:
+            return 0
+        return first_changed_row(self._index, np.vstack([self._prices, self._volume]),
+                                 index, np.vstack([prices, volume]))
     
-    def _bollinger_bands(self, series: pd.Series, length: int = 20, mult: float = 2.0) -> Tuple[pd.Series, pd.Series, pd.Series]:
-        """Bollinger Bands"""
-        middle = series.rolling(length).mean()
-        std = series.rolling(length).std(ddof=0)
-        
-        upper = middle + (mult * std)
-        lower = middle - (mult * std)
-        
-        return middle, upper, lower
+    def _input_arrays(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """Split the frame into a float32 High/Low/Close block and a float64 volume row
+        
+        float32 resolves NQ prices far below the 0.25 tick and halves the
+        bytes the kernels stream; their accumulators stay float64. Volume
+        stays float64 so missing bars remain NaN.
+        """
+        prices = np.vstack([
+            df["High"].to_numpy(dtype=np.float32),
+            df["Low"].to_numpy(dtype=np.float32),
+            df["Close"].to_numpy(dtype=np.float32),
+        ])
+        return prices, df["Volume"].to_numpy(dtype=np.float64)
     
-    def _session_vwap(self, df: pd.DataFrame) -> pd.Series:
-        """Volume Weighted Average Price (session-based)"""
-        if df.empty or "Volume" not in df.columns:
-            return pd.Series(index=df.index, dtype=float)
-        
-        # Calculate typical price
-        typical_price = (df["High"] + df["Low"] + df["Close"]) / 3.0
-        
-        # Handle zero/NaN volumes
-        volume = df["Volume"].fillna(0)
-        volume = volume.replace(0, 1)  # Avoid division by zero
-        
-        # Calculate VWAP
-        vwap = (typical_price * volume).cumsum() / volume.cumsum()
-        
-        return vwap
\ No newline at end of file
+    def _session_keys(self, index: pd.Index) -> np.ndarray:
+        """Map each bar to its trading date (in the index's own timezone) for VWAP resets"""
+        if not isinstance(index, pd.DatetimeIndex):
+            return np.zeros(len(index), dtype=np.int64)
+        
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        return index.normalize().asi8
+    
+    def _build_frame(self, df: pd.DataFrame, outputs: np.ndarray) -> pd.DataFrame:
+        """Join indicator rows onto the input frame"""
+        indicators = pd.DataFrame(outputs[:N_INDICATORS].T, index=df.index, columns=INDICATOR_COLUMNS)
+        return pd.concat([df, indicators], axis=1)
@@ -0,0 +1,407 @@
+"""
+Compiled numeric kernels for indicator calculation and signal scoring
+
+Every kernel fills its output from row ``start`` onward and treats rows
+before ``start`` as already computed, so a caller can recompute only the
+tail of a series after the last bar changes. Kernels release the GIL, so
+indicator work does not stall the OCR and feed threads.
+"""
+
+import numpy as np
+
+# Numba is optional; without it the kernels run as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Rows of the compute_all output; the last four carry recursive state only
+OUTPUT_COLUMNS = (
+    "EMA9", "EMA21", "EMA50",
+    "MACD", "MACDsig", "MACDhist",
+    "RSI14", "StochK", "StochD",
+    "BBmid", "BBup", "BBlo",
+    "VWAP", "VolAvg20",
+    "EMA12", "EMA26", "CumPV", "CumV",
+)
+N_INDICATORS = 14
+
+# Rows of the compute_timeframe output; the last two carry recursive state only
+TIMEFRAME_COLUMNS = (
+    "EMA9", "EMA21", "EMA50",
+    "MACD", "MACDsig",
+    "RSI14",
+    "BBmid", "BBup", "BBlo",
+    "EMA12", "EMA26",
+)
+N_TIMEFRAME_INDICATORS = 9
+
+@njit(cache=True, nogil=True)
+def ema_inplace(out, x, alpha, start):
+    """EMA with pandas ewm(adjust=False) semantics, seeded on the first valid value"""
+    prev = out[start - 1] if start > 0 else np.nan
+    for i in range(start, x.shape[0]):
+        xi = x[i]
+        if np.isnan(prev):
+            prev = xi
+        elif not np.isnan(xi):
+            prev = alpha * xi + (1.0 - alpha) * prev
+        out[i] = prev
+
+@njit(cache=True, nogil=True)
+def rolling_mean(out, x, n, start):
+    """Rolling mean over n values; NaN until the window is full or while it holds a NaN"""
+    total = 0.0
+    nans = 0
+
+    # Prime the window with the values just before start
+    lo = max(start - n + 1, 0)
+    for j in range(lo, start):
+        if np.isnan(x[j]):
+            nans += 1
+        else:
+            total += x[j]
+
+    for i in range(start, x.shape[0]):
+        xi = x[i]
+        if np.isnan(xi):
+            nans += 1
+        else:
+            total += xi
+
+        if i - n >= lo:
+            xo = x[i - n]
+            if np.isnan(xo):
+                nans -= 1
+            else:
+                total -= xo
+
+        if i >= n - 1 and nans == 0:
+            out[i] = total / n
+        else:
+            out[i] = np.nan
+
+@njit(cache=True, nogil=True)
+def rolling_nanmean(out, x, n, start):
+    """Mean of the non-NaN values among the last n, like tail(n).mean(); NaN when all are missing"""
+    total = 0.0
+    count = 0
+
+    # Prime the window with the values just before start
+    lo = max(start - n + 1, 0)
+    for j in range(lo, start):
+        if not np.isnan(x[j]):
+            total += x[j]
+            count += 1
+
+    for i in range(start, x.shape[0]):
+        xi = x[i]
+        if not np.isnan(xi):
+            total += xi
+            count += 1
+
+        if i - n >= lo:
+            xo = x[i - n]
+            if not np.isnan(xo):
+                total -= xo
+                count -= 1
+
+        out[i] = total / count if count > 0 else np.nan
+
+@njit(cache=True, nogil=True)
+def rsi_sma(out, x, n, start):
+    """RSI from simple rolling means of gains and losses
+
+    Scratch rows cover only the window before start and the rows after it.
+    """
+    size = x.shape[0]
+    lo = max(start - n, 0)
+    up = np.empty(size - lo)
+    down = np.empty(size - lo)
+
+    if lo == 0:
+        up[0] = np.nan
+        down[0] = np.nan
+    for i in range(max(lo, 1), size):
+        delta = x[i] - x[i - 1]
+        if np.isnan(delta):
+            up[i - lo] = np.nan
+            down[i - lo] = np.nan
+        else:
+            up[i - lo] = delta if delta > 0 else 0.0
+            down[i - lo] = -delta if delta < 0 else 0.0
+
+    # Scratch index i - lo; past the warm-up every window is full either way
+    avg_up = np.empty(size - lo)
+    avg_down = np.empty(size - lo)
+    rolling_mean(avg_up, up, n, start - lo)
+    rolling_mean(avg_down, down, n, start - lo)
+
+    for i in range(start, size):
+        d = avg_down[i - lo]
+        if d == 0 or np.isnan(d):
+            out[i] = np.nan
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_up[i - lo] / d)
+
+@njit(cache=True, nogil=True)
+def stoch_k(out, high, low, close, n, start):
+    """Stochastic %K over an n-bar high/low window"""
+    for i in range(start, close.shape[0]):
+        if i < n - 1:
+            out[i] = np.nan
+            continue
+
+        lowest = np.inf
+        highest = -np.inf
+        valid = True
+        for j in range(i - n + 1, i + 1):
+            if np.isnan(low[j]) or np.isnan(high[j]):
+                valid = False
+                break
+            if low[j] < lowest:
+                lowest = low[j]
+            if high[j] > highest:
+                highest = high[j]
+
+        if not valid or highest == lowest:
+            out[i] = np.nan
+        else:
+            out[i] = 100.0 * (close[i] - lowest) / (highest - lowest)
+
+@njit(cache=True, nogil=True)
+def bbands(mid, up, lo, x, n, k, start):
+    """Bollinger Bands with population standard deviation"""
+    rolling_mean(mid, x, n, start)
+    for i in range(start, x.shape[0]):
+        m = mid[i]
+        if np.isnan(m):
+            up[i] = np.nan
+            lo[i] = np.nan
+            continue
+
+        var = 0.0
+        for j in range(i - n + 1, i + 1):
+            d = x[j] - m
+            var += d * d
+        std = np.sqrt(var / n)
+
+        up[i] = m + k * std
+        lo[i] = m - k * std
+
+@njit(cache=True, nogil=True)
+def session_vwap(out, cum_pv, cum_v, high, low, close, volume, session, start):
+    """VWAP from typical price, reset whenever the session key changes
+
+    Bars without volume carry no weight; VWAP is NaN until the session
+    has traded volume.
+    """
+    pv = cum_pv[start - 1] if start > 0 else 0.0
+    vol = cum_v[start - 1] if start > 0 else 0.0
+    for i in range(start, close.shape[0]):
+        if i > 0 and session[i] != session[i - 1]:
+            pv = 0.0
+            vol = 0.0
+
+        v = volume[i]
+        if v > 0:
+            # Sum in float64; float32 High + Low alone rounds to 1/256 at NQ prices
+            pv += (np.float64(high[i]) + low[i] + close[i]) / 3.0 * v
+            vol += v
+        cum_pv[i] = pv
+        cum_v[i] = vol
+        out[i] = pv / vol if vol > 0 else np.nan
+
+@njit(cache=True, nogil=True)
+def ema_stack(ema9, ema21, ema50, ema12, ema26, macd, close, start):
+    """Fused pass over all close-price EMAs and the MACD line
+
+    Each EMA seeds from the first close; rows from start on continue the
+    values at start - 1.
+    """
+    a9, a21, a50 = 2.0 / 10.0, 2.0 / 22.0, 2.0 / 51.0
+    a12, a26 = 2.0 / 13.0, 2.0 / 27.0
+    if start > 0:
+        p9, p21, p50 = ema9[start - 1], ema21[start - 1], ema50[start - 1]
+        p12, p26 = ema12[start - 1], ema26[start - 1]
+    else:
+        p9 = p21 = p50 = p12 = p26 = np.nan
+
+    for i in range(start, close.shape[0]):
+        c = close[i]
+        if np.isnan(p9):
+            p9 = p21 = p50 = p12 = p26 = c
+        elif not np.isnan(c):
+            p9 = a9 * c + (1.0 - a9) * p9
+            p21 = a21 * c + (1.0 - a21) * p21
+            p50 = a50 * c + (1.0 - a50) * p50
+            p12 = a12 * c + (1.0 - a12) * p12
+            p26 = a26 * c + (1.0 - a26) * p26
+        ema9[i] = p9
+        ema21[i] = p21
+        ema50[i] = p50
+        ema12[i] = p12
+        ema26[i] = p26
+        macd[i] = p12 - p26
+
+@njit(cache=True, nogil=True)
+def compute_all(out, high, low, close, volume, session, start):
+    """Fill out[:, start:] with the full indicator set (rows follow OUTPUT_COLUMNS)"""
+    macd, macd_sig, macd_hist = out[3], out[4], out[5]
+
+    ema_stack(out[0], out[1], out[2], out[14], out[15], macd, close, start)
+
+    ema_inplace(macd_sig, macd, 2.0 / 10.0, start)
+    for i in range(start, close.shape[0]):
+        macd_hist[i] = macd[i] - macd_sig[i]
+
+    rsi_sma(out[6], close, 14, start)
+
+    stoch_k(out[7], high, low, close, 14, start)
+    rolling_mean(out[8], out[7], 3, start)
+
+    bbands(out[9], out[10], out[11], close, 20, 2.0, start)
+
+    session_vwap(out[12], out[16], out[17], high, low, close, volume, session, start)
+
+    # Volume baseline for the confluence volume check
+    rolling_nanmean(out[13], volume, 20, start)
+
+@njit(cache=True, nogil=True)
+def compute_timeframe(out, close, start):
+    """Fill out[:, start:] with the higher timeframe indicator set (rows follow TIMEFRAME_COLUMNS)"""
+    macd, macd_sig = out[3], out[4]
+
+    ema_stack(out[0], out[1], out[2], out[9], out[10], macd, close, start)
+
+    ema_inplace(macd_sig, macd, 2.0 / 10.0, start)
+    rsi_sma(out[5], close, 14, start)
+    bbands(out[6], out[7], out[8], close, 20, 2.0, start)
+
+
+# Bits of the score_confluence flags, in the order their reasons are listed
+CONFLUENCE_REASONS = (
+    "4h bearish trend",
+    "4h bullish trend",
+    "60m bearish trend",
+    "60m bullish trend",
+    "15m bearish trend",
+    "15m bullish trend",
+    "Complete bear EMA stack",
+    "Partial bear EMA stack",
+    "MACD bearish momentum",
+    "RSI overbought (>70)",
+    "RSI elevated (>60)",
+    "RSI oversold (<30)",
+    "Price above upper Bollinger Band",
+    "Price below lower Bollinger Band",
+    "Below session VWAP",
+    "Above session VWAP",
+    "Opening Range low break",
+    "Opening Range high break",
+    "Stochastic bear cross from overbought",
+    "High volume confirms bear signal",
+)
+
+@njit(cache=True)
+def score_confluence(close, ema9, ema21, ema50, macd, macd_sig, macd_hist, rsi,
+                     bb_up, bb_lo, vwap, stoch_k, stoch_d, or_low, or_high, or_ready,
+                     volume, avg_volume, htf_bias_4h, htf_bias_60m, htf_bias_15m):
+    """Confluence score and reason flags for the latest bar
+
+    Higher timeframe biases are +1 bearish, -1 bullish, 0 neutral or
+    unavailable. Missing opening range levels are passed as NaN.
+    """
+    score = 50.0
+    flags = 0
+
+    # Higher timeframe bias
+    if htf_bias_4h > 0:
+        score += 15
+        flags |= 1 << 0
+    elif htf_bias_4h < 0:
+        score -= 15 * 0.7  # Slightly less penalty for bull
+        flags |= 1 << 1
+    if htf_bias_60m > 0:
+        score += 10
+        flags |= 1 << 2
+    elif htf_bias_60m < 0:
+        score -= 10 * 0.7
+        flags |= 1 << 3
+    if htf_bias_15m > 0:
+        score += 8
+        flags |= 1 << 4
+    elif htf_bias_15m < 0:
+        score -= 8 * 0.7
+        flags |= 1 << 5
+
+    # EMA stack analysis
+    if close < ema9 and ema9 < ema21 and ema21 < ema50:
+        score += 8
+        flags |= 1 << 6
+    elif ema9 < ema21 and ema21 < ema50:
+        score += 4
+        flags |= 1 << 7
+
+    # MACD momentum
+    if macd < macd_sig and macd_hist < 0:
+        score += 5
+        flags |= 1 << 8
+
+    # RSI conditions
+    if rsi >= 70:
+        score += 6
+        flags |= 1 << 9
+    elif rsi >= 60:
+        score += 3
+        flags |= 1 << 10
+    elif rsi <= 30:
+        score -= 4
+        flags |= 1 << 11
+
+    # Bollinger Bands
+    if close > bb_up:
+        score += 6
+        flags |= 1 << 12
+    elif close < bb_lo:
+        score -= 3
+        flags |= 1 << 13
+
+    # VWAP analysis
+    if not np.isnan(vwap):
+        if close < vwap:
+            score += 4
+            flags |= 1 << 14
+        else:
+            score -= 2
+            flags |= 1 << 15
+
+    # Opening Range analysis
+    if or_ready and close < or_low:
+        score += 8
+        flags |= 1 << 16
+    elif or_ready and close > or_high:
+        score -= 5
+        flags |= 1 << 17
+
+    # Stochastic
+    if stoch_k < stoch_d and stoch_k > 80:
+        score += 4
+        flags |= 1 << 18
+
+    # Volume confirmation when already bearish
+    if volume > avg_volume * 1.5 and score > 50:
+        score += 3
+        flags |= 1 << 19
+
+    return max(0, min(100, int(score))), np.uint32(flags)
+
+# Prefer the ahead-of-time build (scripts/build_signal_kernels.py) so the
+# first tick after launch skips JIT compilation
+try:
+    from .nq_kernels import compute_all, compute_timeframe, score_confluence
+except ImportError:
+    pass
\ No newline at end of file
@@ -2,12 +2,34 @@
 News feed integration for market context
 """
 
+import re
 import time
+import random
+import logging
+import heapq
 import threading
+import numpy as np
+import pandas as pd
 import requests
-import json
+from requests.adapters import HTTPAdapter, Retry
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Tuple
+
+from .runtime import SHARED_POOL
+
+# orjson is optional; without it payloads go through requests' stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pyahocorasick is optional; without it keywords are matched with one compiled regex
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+logger = logging.getLogger(__name__)
 
 # Timezone
 try:
@@ -23,20 +45,44 @@ def now_et():
 class NewsFeed:
     """ForexFactory news feed integration"""
     
+    MAX_BACKOFF_SEC = 60
+    
     def __init__(self, config):
         self.config = config
         self._running = False
-        self._stop_event = threading.Event()
+        self._timer: Optional[threading.Timer] = None
+        self._generation = 0
         
-        self.news_items = []
+        # Replaced, never mutated, on each change, so readers share it without copying
+        self.news_items: Tuple[Dict, ...] = ()
         self.last_update = 0
         
+        # Column view of news_items for sentiment: lowercased titles and high-impact flags
+        self._news_columns: Tuple[List[str], np.ndarray] = ([], np.zeros(0, dtype=bool))
+        
+        # Called with the new items whenever a fetch changes them, and with a message when one fails
+        self.on_update: Optional[Callable[[Tuple[Dict, ...]], None]] = None
+        self.on_error: Optional[Callable[[str], None]] = None
+        self._news_signature = None
+        
+        # One keep-alive session reused across polls
+        self._session = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retries))
+        self._consec_fail = 0
+        
+        # Validators from the last full response, for conditional requests
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        
         # Bearish keywords for market sentiment
         self.bearish_keywords = [
             "inflation", "hawkish", "rate hike", "unemployment low", 
             "cpi higher", "hot inflation", "fed hawkish", "rates higher",
             "tightening", "contractionary", "bear", "recession", "downturn"
         ]
+        self._kw_automaton = self._build_keyword_automaton(self.bearish_keywords)
+        self._kw_re = re.compile(r"\b(?:" + "|".join(map(re.escape, self.bearish_keywords)) + r")\b", re.IGNORECASE)
         
     def start(self):
         """Start news feed"""
@@ -44,38 +90,29 @@ class NewsFeed:
             return
         
         self._running = True
-        self._stop_event.clear()
-        
-        self.news_thread = threading.Thread(target=self._news_loop, daemon=True)
-        self.news_thread.start()
+        self._generation += 1
+        self._schedule(0, self._generation)
     
     def stop(self):
         """Stop news feed"""
         self._running = False
-        self._stop_event.set()
+        if self._timer is not None:
+            self._timer.cancel()
     
-    def get_news_items(self) -> List[Dict]:
-        """Get current news items"""
-        return self.news_items.copy()
+    def get_news_items(self) -> Tuple[Dict, ...]:
+        """Get current news items, newest first"""
+        return self.news_items
     
     def get_market_sentiment(self) -> str:
         """Analyze recent news for market sentiment"""
-        if not self.news_items:
+        titles_lower, impact_high = self._news_columns
+        if not titles_lower:
             return "NEUTRAL"
         
-        # Check recent high-impact news
-        recent_news = [item for item in self.news_items[:10]]
-        bearish_count = 0
-        
-        for item in recent_news:
-            title_lower = item.get("title", "").lower()
-            impact = item.get("impact", "")
-            
-            # Weight high-impact news more heavily
-            weight = 2 if "High" in impact else 1
-            
-            if any(keyword in title_lower for keyword in self.bearish_keywords):
-                bearish_count += weight
+        # Check recent news, weighting high-impact items more heavily
+        hits = [self._has_bearish_keyword(title) for title in titles_lower[:10]]
+        weights = np.where(impact_high[:10], 2, 1)
+        bearish_count = int(weights[hits].sum())
         
         if bearish_count >= 3:
             return "BEARISH"
@@ -84,64 +121,163 @@ class NewsFeed:
         else:
             return "NEUTRAL"
     
-    def _news_loop(self):
-        """Main news fetching loop"""
-        while self._running and not self._stop_event.is_set():
-            try:
-                current_time = time.time()
-                if current_time - self.last_update > self.config.news_poll_sec:
-                    self._fetch_news()
-                    self.last_update = current_time
-                    
-            except Exception as e:
-                print(f"News feed error: {e}")
+    def _build_keyword_automaton(self, keywords: List[str]):
+        """Compile keywords into one Aho-Corasick automaton, or None without pyahocorasick"""
+        if ahocorasick is None:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+    
+    def _has_bearish_keyword(self, title_lower: str) -> bool:
+        """Check a lowercased title for any bearish keyword, as whole words, in a single pass"""
+        if self._kw_automaton is None:
+            return self._kw_re.search(title_lower) is not None
+        
+        # The automaton matches substrings; keep only hits that sit on word boundaries
+        for end, keyword in self._kw_automaton.iter(title_lower):
+            start = end - len(keyword) + 1
+            if start > 0 and self._is_word_char(title_lower[start - 1]):
+                continue
+            if end + 1 < len(title_lower) and self._is_word_char(title_lower[end + 1]):
+                continue
+            return True
+        return False
+    
+    @staticmethod
+    def _is_word_char(char: str) -> bool:
+        """Match the regex notion of a word character"""
+        return char.isalnum() or char == "_"
+    
+    def _parse_iso_time(self, date_str: str) -> Optional[datetime]:
+        """Parse a full ISO 8601 timestamp into ET, or None if date_str is not one"""
+        if "T" not in date_str:
+            return None
+        
+        try:
+            event_dt = datetime.fromisoformat(date_str)
+        except ValueError:
+            return None
+        
+        if event_dt.tzinfo is None:
+            return event_dt.replace(tzinfo=ET)
+        return event_dt.astimezone(ET)
+    
+    def _schedule(self, delay: float, generation: int):
+        """Queue the next poll on the shared pool after delay seconds"""
+        self._timer = threading.Timer(delay, self._submit_poll, args=(generation,))
+        self._timer.daemon = True
+        self._timer.start()
+    
+    def _submit_poll(self, generation: int):
+        """Hand a poll to the shared pool, unless the app is shutting it down"""
+        try:
+            SHARED_POOL.submit(self._poll, generation)
+        except RuntimeError:
+            pass
+    
+    def _poll(self, generation: int):
+        """Fetch once, then schedule the next poll; stale generations from before a restart stop here"""
+        if not self._running or generation != self._generation:
+            return
+        
+        delay = self.config.news_poll_sec
+        try:
+            self._fetch_news()
+            self.last_update = time.time()
+            self._consec_fail = 0
             
-            self._stop_event.wait(5)  # Check every 5 seconds
+        except Exception as e:
+            # Back off exponentially, with jitter, while the calendar is unreachable
+            self._consec_fail += 1
+            delay = min(self.MAX_BACKOFF_SEC, 2 ** self._consec_fail + random.random())
+            logger.warning("News fetch failed (attempt %d), retrying in %.1fs: %s",
+                           self._consec_fail, delay, e)
+            if self.on_error is not None:
+                self.on_error(f"News feed error: {e}")
+        
+        if self._running and generation == self._generation:
+            self._schedule(delay, generation)
     
     def _fetch_news(self):
-        """Fetch news from ForexFactory"""
-        try:
-            response = requests.get(self.config.ff_json_url, timeout=10)
-            response.raise_for_status()
+        """Fetch news from ForexFactory; failures propagate to _poll for backoff"""
+        headers = {}
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
+        
+        response = self._session.get(self.config.ff_json_url, headers=headers, timeout=10)
+        if response.status_code == 304:
+            return  # Calendar unchanged since the last fetch
+        response.raise_for_status()
+        
+        data = orjson.loads(response.content) if orjson is not None else response.json()
+        news_items = []
+        stamps = []
+        iso_times = []
+        raw_times = []
+        
+        for event in data:
+            title = event.get("title") or event.get("event") or ""
+            if not title:
+                continue
             
-            data = response.json()
-            news_items = []
+            impact = (event.get("impact") or "").strip()
+            date_str = event.get("date") or ""
+            time_str = event.get("time") or ""
+            country = event.get("country") or ""
             
-            for event in data:
-                title = event.get("title") or event.get("event") or ""
-                if not title:
-                    continue
-                
-                impact = (event.get("impact") or "").strip()
-                date_str = event.get("date") or ""
-                time_str = event.get("time") or ""
-                country = event.get("country") or ""
-                
-                # Parse datetime
-                try:
-                    if date_str and time_str:
-                        event_dt = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
-                        event_dt = event_dt.replace(tzinfo=ET)
-                    else:
-                        event_dt = now_et()
-                except:
-                    event_dt = now_et()
-                
-                news_item = {
-                    "time": event_dt,
-                    "title": title,
-                    "impact": impact,
-                    "country": country,
-                    "actual": event.get("actual", ""),
-                    "forecast": event.get("forecast", ""),
-                    "previous": event.get("previous", "")
-                }
-                
-                news_items.append(news_item)
+            news_item = {
+                "title": title,
+                "impact": impact,
+                "country": country,
+                "actual": event.get("actual", ""),
+                "forecast": event.get("forecast", ""),
+                "previous": event.get("previous", "")
+            }
             
-            # Sort by time (newest first) and limit
-            news_items.sort(key=lambda x: x["time"], reverse=True)
-            self.news_items = news_items[:self.config.max_news_items]
+            news_items.append(news_item)
+            raw_times.append((date_str, time_str))
+            stamps.append(f"{date_str} {time_str}" if date_str and time_str else "")
+            iso_times.append(self._parse_iso_time(date_str) if not time_str else None)
+        
+        # Parse date/time pairs in one pass; missing, malformed or DST-gap times fall back to now
+        event_times = pd.to_datetime(stamps, format="%Y-%m-%d %H:%M", errors="coerce")
+        event_times = event_times.tz_localize(ET, ambiguous="NaT", nonexistent="NaT")
+        fetched_at = now_et()
+        for news_item, iso_dt, event_dt in zip(news_items, iso_times, event_times):
+            if iso_dt is not None:
+                news_item["time"] = iso_dt
+            elif pd.isna(event_dt):
+                news_item["time"] = fetched_at
+            else:
+                news_item["time"] = event_dt.to_pydatetime()
+        
+        # Publish only when the calendar actually changed. Hash the raw date/time
+        # strings rather than the parsed times, since undated events fall back to
+        # the fetch time; a rescheduled event still changes its strings.
+        signature = hash(tuple(
+            (item["title"], item["impact"], item["country"], item["actual"], item["forecast"], item["previous"],
+             date_str, time_str)
+            for item, (date_str, time_str) in zip(news_items, raw_times)
+        ))
+        if signature != self._news_signature:
+            self._news_signature = signature
             
-        except Exception as e:
-            print(f"Error fetching news: {e}")
\ No newline at end of file
+            # Keep the newest items, newest first
+            news_items = heapq.nlargest(self.config.max_news_items, news_items, key=lambda x: x["time"])
+            self._news_columns = (
+                [item["title"].lower() for item in news_items],
+                np.array(["High" in item["impact"] for item in news_items], dtype=bool),
+            )
+            self.news_items = tuple(news_items)
+            if self.on_update is not None:
+                self.on_update(self.news_items)
+        
+        # Only remember validators once the payload has been applied
+        self._etag = response.headers.get("ETag")
+        self._last_modified = response.headers.get("Last-Modified")
\ No newline at end of file
@@ -0,0 +1,21 @@
+"""
+Process-wide worker pools shared by the feeds and signal engine
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+# Shut down by the main window on close
+SHARED_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="nq")
+
+# Timeframe builds run under the engine's state lock, so they get their own
+# workers rather than queueing behind a news poll stuck in an HTTP timeout
+TIMEFRAME_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="nq-tf")
+
+def shutdown_pool():
+    """Stop the worker pools without waiting
+    
+    Work already queued still runs; news polls see the stopped feed and
+    return, and the next submit fails so nothing new is scheduled.
+    """
+    SHARED_POOL.shutdown(wait=False)
+    TIMEFRAME_POOL.shutdown(wait=False)
\ No newline at end of file
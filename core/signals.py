@@ -2,11 +2,19 @@
 Trading signal generation and confluence analysis
 """
 
+import threading
 import numpy as np
 import pandas as pd
-from typing import Tuple, List, Dict
+from typing import Optional, Tuple, List, Dict
 from datetime import datetime
 
+from .indicators import first_changed_row
+from .runtime import TIMEFRAME_POOL
+from .kernels import (compute_timeframe, score_confluence, CONFLUENCE_REASONS,
+                      TIMEFRAME_COLUMNS, N_TIMEFRAME_INDICATORS)
+
+TIMEFRAME_INDICATOR_COLUMNS = TIMEFRAME_COLUMNS[:N_TIMEFRAME_INDICATORS]
+
 # Timezone
 try:
     from zoneinfo import ZoneInfo
@@ -21,16 +29,63 @@ def now_et():
 class SignalEngine:
     """Generate trading signals based on technical analysis"""
     
+    BIAS_COLUMNS = ["Close", "EMA9", "EMA21", "EMA50", "VWAP", "MACD", "MACDsig", "RSI14", "BBup", "BBlo"]
+    
+    # Columns of the _analyze_bias condition matrix: (reason, score contribution)
+    BIAS_RULES = (
+        ("Complete bear EMA stack", 10),
+        ("Complete bull EMA stack", -10),
+        ("Below fast EMA", 4),
+        ("Above fast EMA", -4),
+        ("Below VWAP", 4),
+        ("Above VWAP", -2),
+        ("MACD bearish", 4),
+        ("MACD bullish", -2),
+        ("RSI overbought", 6),
+        ("RSI oversold", -4),
+        ("Outside upper band", 6),
+        ("Outside lower band", -3),
+    )
+    BIAS_REASONS = tuple(reason for reason, _ in BIAS_RULES)
+    BIAS_WEIGHTS = np.array([weight for _, weight in BIAS_RULES], dtype=np.int64)
+    BIAS_DIRECTION = {"BEARISH": 1, "BULLISH": -1, "NEUTRAL": 0}
+    
+    CONFLUENCE_COLUMNS = ["Close", "EMA9", "EMA21", "EMA50", "MACD", "MACDsig", "MACDhist", "RSI14",
+                          "BBup", "BBlo", "VWAP", "StochK", "StochD", "Volume", "VolAvg20"]
+    
+    # Higher timeframes and how 1m bars aggregate into them
+    TIMEFRAMES = {
+        "5m": "5min",
+        "15m": "15min",
+        "60m": "60min",
+        "4h": "240min"
+    }
+    AGG_RULES = {
+        "Open": "first",
+        "High": "max",
+        "Low": "min",
+        "Close": "last",
+        "Volume": "sum"
+    }
+    
     def __init__(self, config):
         self.config = config
+        
+        # Incremental state for _create_timeframes
+        self._tf_lock = threading.Lock()
+        self._tf_index: Optional[pd.Index] = None
+        self._tf_inputs: Optional[np.ndarray] = None
+        self._tf_origin: Optional[pd.Timestamp] = None
+        self._tf_cache: Dict[str, pd.DataFrame] = {}
+        self._tf_state: Dict[str, np.ndarray] = {}
     
     def generate_signal(self, df: pd.DataFrame) -> Tuple[str, int, List[str]]:
         """Generate primary trading signal"""
         if df.empty or len(df) < 10:
             return "NEUTRAL", 50, ["Insufficient data"]
         
-        latest_row = df.iloc[-1]
-        return self._analyze_bias(latest_row)
+        biases, scores, conditions = self._analyze_bias(self._with_columns(df.iloc[-1:], self.BIAS_COLUMNS))
+        return str(biases[0]), int(scores[0]), self._bias_reasons(conditions[0])
     
     def confluence_analysis(self, df: pd.DataFrame, or_high: float = None, 
                           or_low: float = None, or_ready: bool = False) -> Tuple[int, List[str]]:
@@ -38,217 +93,185 @@ class SignalEngine:
         if df.empty or len(df) < 30:
             return 50, ["Warming up - need more data"]
         
-        score = 50  # Start neutral
-        reasons = []
-        
         # Get multi-timeframe data
         frames = self._create_timeframes(df)
         
-        # Higher timeframe bias
-        for tf, weight in [("4h", 15), ("60m", 10), ("15m", 8)]:
-            if tf in frames and not frames[tf].empty:
-                tf_bias, tf_score, _ = self._analyze_bias(frames[tf].iloc[-1])
-                if tf_bias == "BEARISH":
-                    score += weight
-                    reasons.append(f"{tf} bearish trend")
-                elif tf_bias == "BULLISH":
-                    score -= weight * 0.7  # Slightly less penalty for bull
-                    reasons.append(f"{tf} bullish trend")
+        # Higher timeframe bias, scored together from each frame's last bar
+        htf_bias = {}
+        htf = [tf for tf in ("4h", "60m", "15m") if tf in frames and not frames[tf].empty]
+        if htf:
+            last_bars = pd.concat([frames[tf].iloc[-1:] for tf in htf])
+            tf_biases, _, _ = self._analyze_bias(self._with_columns(last_bars, self.BIAS_COLUMNS))
+            htf_bias = {tf: self.BIAS_DIRECTION[bias] for tf, bias in zip(htf, tf_biases)}
         
         # Current 1m analysis
-        latest = df.iloc[-1]
-        
-        # EMA stack analysis
-        if latest["Close"] < latest["EMA9"] < latest["EMA21"] < latest["EMA50"]:
-            score += 8
-            reasons.append("Complete bear EMA stack")
-        elif latest["EMA9"] < latest["EMA21"] < latest["EMA50"]:
-            score += 4
-            reasons.append("Partial bear EMA stack")
-        
-        # MACD momentum
-        if latest["MACD"] < latest["MACDsig"] and latest["MACDhist"] < 0:
-            score += 5
-            reasons.append("MACD bearish momentum")
-        
-        # RSI conditions
-        if latest["RSI14"] >= 70:
-            score += 6
-            reasons.append("RSI overbought (>70)")
-        elif latest["RSI14"] >= 60:
-            score += 3
-            reasons.append("RSI elevated (>60)")
-        elif latest["RSI14"] <= 30:
-            score -= 4
-            reasons.append("RSI oversold (<30)")
-        
-        # Bollinger Bands
-        if latest["Close"] > latest["BBup"]:
-            score += 6
-            reasons.append("Price above upper Bollinger Band")
-        elif latest["Close"] < latest["BBlo"]:
-            score -= 3
-            reasons.append("Price below lower Bollinger Band")
-        
-        # VWAP analysis
-        if not np.isnan(latest["VWAP"]):
-            if latest["Close"] < latest["VWAP"]:
-                score += 4
-                reasons.append("Below session VWAP")
-            else:
-                score -= 2
-                reasons.append("Above session VWAP")
-        
-        # Opening Range analysis
-        if or_ready and or_low is not None and latest["Close"] < or_low:
-            score += 8
-            reasons.append("Opening Range low break")
-        elif or_ready and or_high is not None and latest["Close"] > or_high:
-            score -= 5
-            reasons.append("Opening Range high break")
-        
-        # Stochastic
-        if latest["StochK"] < latest["StochD"] and latest["StochK"] > 80:
-            score += 4
-            reasons.append("Stochastic bear cross from overbought")
-        
-        # Volume consideration (if available)
-        if len(df) >= 20:
-            avg_volume = df["Volume"].tail(20).mean()
-            current_volume = latest["Volume"]
-            if current_volume > avg_volume * 1.5:
-                if score > 50:  # If already bearish
-                    score += 3
-                    reasons.append("High volume confirms bear signal")
-        
-        # Ensure score stays in bounds
-        final_score = max(0, min(100, int(score)))
+        (close, ema9, ema21, ema50, macd, macd_sig, macd_hist, rsi,
+         bb_up, bb_lo, vwap, stoch_k, stoch_d, volume, avg_volume) = self._with_columns(
+            df.iloc[-1:], self.CONFLUENCE_COLUMNS)[self.CONFLUENCE_COLUMNS].to_numpy(dtype=np.float64)[0]
+        
+        final_score, flags = score_confluence(
+            close, ema9, ema21, ema50, macd, macd_sig, macd_hist, rsi,
+            bb_up, bb_lo, vwap, stoch_k, stoch_d,
+            np.nan if or_low is None else float(or_low),
+            np.nan if or_high is None else float(or_high),
+            bool(or_ready), volume, avg_volume,
+            htf_bias.get("4h", 0), htf_bias.get("60m", 0), htf_bias.get("15m", 0),
+        )
+        reasons = [reason for bit, reason in enumerate(CONFLUENCE_REASONS) if flags >> bit & 1]
         
         return final_score, reasons[:8]  # Limit reasons for display
     
-    def _analyze_bias(self, row: pd.Series) -> Tuple[str, int, List[str]]:
-        """Analyze single row for bias"""
-        score = 50
-        reasons = []
-        
-        # EMA relationships
-        if row["Close"] < row["EMA9"] < row["EMA21"] < row["EMA50"]:
-            score += 10
-            reasons.append("Complete bear EMA stack")
-        elif row["Close"] > row["EMA9"] > row["EMA21"] > row["EMA50"]:
-            score -= 10
-            reasons.append("Complete bull EMA stack")
-        elif row["Close"] < row["EMA9"]:
-            score += 4
-            reasons.append("Below fast EMA")
-        elif row["Close"] > row["EMA9"]:
-            score -= 4
-            reasons.append("Above fast EMA")
-        
-        # VWAP
-        if not np.isnan(row.get("VWAP", np.nan)):
-            if row["Close"] < row["VWAP"]:
-                score += 4
-                reasons.append("Below VWAP")
-            else:
-                score -= 2
-                reasons.append("Above VWAP")
-        
-        # MACD
-        if row["MACD"] < row["MACDsig"]:
-            score += 4
-            reasons.append("MACD bearish")
-        else:
-            score -= 2
-            reasons.append("MACD bullish")
-        
-        # RSI extremes
-        if row["RSI14"] >= 70:
-            score += 6
-            reasons.append("RSI overbought")
-        elif row["RSI14"] <= 30:
-            score -= 4
-            reasons.append("RSI oversold")
-        
-        # Bollinger Bands
-        if row["Close"] > row.get("BBup", np.inf):
-            score += 6
-            reasons.append("Outside upper band")
-        elif row["Close"] < row.get("BBlo", -np.inf):
-            score -= 3
-            reasons.append("Outside lower band")
+    def _analyze_bias(self, rows: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Analyze each row for bias
+        
+        rows must hold every BIAS_COLUMNS column (see _with_columns). Returns
+        per-row bias labels, scores, and the BIAS_RULES condition matrix that
+        produced them (see _bias_reasons).
+        """
+        values = rows[self.BIAS_COLUMNS].to_numpy(dtype=np.float64)
+        close, ema9, ema21, ema50, vwap, macd, macd_sig, rsi, bb_up, bb_lo = values.T
+        
+        bear_stack = (close < ema9) & (ema9 < ema21) & (ema21 < ema50)
+        bull_stack = (close > ema9) & (ema9 > ema21) & (ema21 > ema50)
+        below_vwap = close < vwap
+        has_vwap = ~np.isnan(vwap)
+        macd_bear = macd < macd_sig
+        overbought = rsi >= 70
+        above_band = close > bb_up
+        
+        conditions = np.column_stack([
+            # EMA relationships
+            bear_stack,
+            bull_stack,
+            (close < ema9) & ~bear_stack,
+            (close > ema9) & ~bull_stack,
+            # VWAP
+            has_vwap & below_vwap,
+            has_vwap & ~below_vwap,
+            # MACD
+            macd_bear,
+            ~macd_bear,
+            # RSI extremes
+            overbought,
+            (rsi <= 30) & ~overbought,
+            # Bollinger Bands
+            above_band,
+            (close < bb_lo) & ~above_band,
+        ])
         
         # Determine bias
-        final_score = max(0, min(100, int(score)))
+        scores = np.clip(50 + conditions @ self.BIAS_WEIGHTS, 0, 100)
+        biases = np.where(scores >= 65, "BEARISH", np.where(scores <= 35, "BULLISH", "NEUTRAL"))
         
-        if final_score >= 65:
-            bias = "BEARISH"
-        elif final_score <= 35:
-            bias = "BULLISH"
-        else:
-            bias = "NEUTRAL"
+        return biases, scores, conditions
+    
+    def _with_columns(self, rows: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        """Add any missing columns as NaN
         
-        return bias, final_score, reasons
+        Higher timeframes carry no VWAP and warm-up frames no indicators; NaN
+        fails every comparison, just like the absent value would.
+        """
+        missing = [col for col in columns if col not in rows.columns]
+        if missing:
+            return rows.assign(**dict.fromkeys(missing, np.nan))
+        return rows
+    
+    def _bias_reasons(self, conditions: np.ndarray) -> List[str]:
+        """Reasons for one row of the _analyze_bias condition matrix"""
+        return [reason for reason, fired in zip(self.BIAS_REASONS, conditions) if fired]
     
     def _create_timeframes(self, df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
-        """Create higher timeframe data"""
+        """Create higher timeframe data, reusing bars closed before the first changed minute
+        
+        Yahoo merges can revise recent minutes as well as append new ones, so
+        the input is compared against the previous call rather than trusting
+        the last timestamp. The returned frames are shared between calls and
+        must not be modified.
+        """
         if df.empty:
             return {}
         
-        frames = {"1m": df}
-        
-        # Aggregation rules
-        agg_rules = {
-            "Open": "first",
-            "High": "max",
-            "Low": "min",
-            "Close": "last",
-            "Volume": "sum"
-        }
-        
-        # Create timeframes
-        timeframe_configs = {
-            "5m": "5min",
-            "15m": "15min", 
-            "60m": "60min",
-            "4h": "240min"
-        }
-        
-        for tf_name, tf_rule in timeframe_configs.items():
-            try:
-                tf_df = df.resample(tf_rule).agg(agg_rules).dropna()
-                if tf_df.empty:
+        with self._tf_lock:
+            inputs = df[list(self.AGG_RULES)].to_numpy(dtype=np.float64).T
+            start = 0
+            if self._tf_index is not None:
+                start = first_changed_row(self._tf_index, self._tf_inputs, df.index, inputs)
+            
+            if start == len(df) and len(df) == len(self._tf_index):
+                return {"1m": df, **self._tf_cache}
+            
+            # A shrunk frame that is a prefix of the last one still re-aggregates its last bar
+            start = min(start, len(df) - 1)
+            
+            if start == 0:
+                # Rebuild from scratch with resample's default start-of-day bin origin
+                self._tf_cache.clear()
+                self._tf_state.clear()
+                self._tf_origin = df.index[0].normalize()
+            
+            # Timeframes are independent; resampling and the kernels overlap across workers
+            futures = {}
+            for tf_name, tf_rule in self.TIMEFRAMES.items():
+                try:
+                    futures[tf_name] = TIMEFRAME_POOL.submit(self._update_timeframe, tf_name, tf_rule, df, start)
+                except RuntimeError:
+                    futures[tf_name] = None  # Pool shut down at exit; build inline below
+            
+            frames = {"1m": df}
+            for tf_name, future in futures.items():
+                try:
+                    if future is None:
+                        tf_df = self._update_timeframe(tf_name, self.TIMEFRAMES[tf_name], df, start)
+                    else:
+                        tf_df = future.result()
+                    if tf_df.empty:
+                        continue
+                    
+                    frames[tf_name] = tf_df
+                    
+                except Exception as e:
+                    print(f"Error creating {tf_name} timeframe: {e}")
+                    self._tf_cache.pop(tf_name, None)
                     continue
-                
-                # Add basic indicators to higher timeframes
-                tf_df["EMA9"] = tf_df["Close"].ewm(span=9, adjust=False).mean()
-                tf_df["EMA21"] = tf_df["Close"].ewm(span=21, adjust=False).mean()
-                tf_df["EMA50"] = tf_df["Close"].ewm(span=50, adjust=False).mean()
-                
-                # MACD
-                ema12 = tf_df["Close"].ewm(span=12, adjust=False).mean()
-                ema26 = tf_df["Close"].ewm(span=26, adjust=False).mean()
-                tf_df["MACD"] = ema12 - ema26
-                tf_df["MACDsig"] = tf_df["MACD"].ewm(span=9, adjust=False).mean()
-                
-                # RSI
-                delta = tf_df["Close"].diff()
-                up = delta.clip(lower=0).rolling(14).mean()
-                down = (-delta.clip(upper=0)).rolling(14).mean()
-                rs = up / down.replace(0, np.nan)
-                tf_df["RSI14"] = 100 - (100 / (1 + rs))
-                
-                # Bollinger Bands
-                bb_mid = tf_df["Close"].rolling(20).mean()
-                bb_std = tf_df["Close"].rolling(20).std(ddof=0)
-                tf_df["BBmid"] = bb_mid
-                tf_df["BBup"] = bb_mid + (2.0 * bb_std)
-                tf_df["BBlo"] = bb_mid - (2.0 * bb_std)
-                
-                frames[tf_name] = tf_df
-                
-            except Exception as e:
-                print(f"Error creating {tf_name} timeframe: {e}")
-                continue
-        
-        return frames
\ No newline at end of file
+            
+            self._tf_index = df.index
+            self._tf_inputs = inputs
+            return frames
+    
+    def _update_timeframe(self, tf_name: str, tf_rule: str, df: pd.DataFrame, start: int) -> pd.DataFrame:
+        """Re-aggregate one timeframe from the bar holding 1m row start onward
+        
+        Frames are stored as float32; the indicator state they are cut from
+        stays float64 so the recursive EMAs do not drift.
+        """
+        cached = self._tf_cache.get(tf_name)
+        
+        # Bars that ended before the first changed minute are kept as they are
+        keep = 0
+        if cached is not None and start > 0:
+            keep = max(int(cached.index.searchsorted(df.index[start], side="right")) - 1, 0)
+        
+        tail = df.iloc[df.index.searchsorted(cached.index[keep]):] if keep else df
+        bars = tail.resample(tf_rule, origin=self._tf_origin).agg(self.AGG_RULES).dropna().astype(np.float32)
+        
+        state = np.empty((len(TIMEFRAME_COLUMNS), keep + len(bars)))
+        if keep:
+            state[:, :keep] = self._tf_state[tf_name][:, :keep]
+        close = bars["Close"].to_numpy(dtype=np.float32)
+        if keep:
+            close = np.concatenate([cached["Close"].to_numpy(dtype=np.float32)[:keep], close])
+        compute_timeframe(state, close, keep)
+        
+        # Add basic indicators to the re-aggregated bars
+        indicators = pd.DataFrame(state[:N_TIMEFRAME_INDICATORS, keep:].T.astype(np.float32), index=bars.index,
+                                  columns=TIMEFRAME_INDICATOR_COLUMNS)
+        tf_df = pd.concat([bars, indicators], axis=1)
+        if keep:
+            tf_df = pd.concat([cached.iloc[:keep], tf_df])
+        
+        if tf_df.empty:
+            self._tf_cache.pop(tf_name, None)
+        else:
+            self._tf_cache[tf_name] = tf_df
+            self._tf_state[tf_name] = state
+        return tf_df
\ No newline at end of file
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Build the Numba kernels ahead of time into core/nq_kernels
+
+The compiled module replaces the JIT entry points in core.kernels, so the
+first tick after launch does not pay the compile cost. Requires numba and
+a C compiler; rerun after changing core/kernels.py.
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from numba.pycc import CC
+
+from core import kernels
+
+# Entry-point signatures must match how the engines call them
+SIGNATURES = {
+    "compute_all": "void(f8[:, :], f4[:], f4[:], f4[:], f8[:], i8[:], i8)",
+    "compute_timeframe": "void(f8[:, :], f4[:], i8)",
+    "score_confluence": "Tuple((i8, u4))(" + ", ".join(["f8"] * 15 + ["b1", "f8", "f8", "i8", "i8", "i8"]) + ")",
+}
+
+def main():
+    cc = CC("nq_kernels")
+    cc.output_dir = os.path.join(ROOT, "core")
+    cc.verbose = True
+    
+    for name, signature in SIGNATURES.items():
+        cc.export(name, signature)(getattr(kernels, name).py_func)
+    
+    cc.compile()
+    print(f"Built nq_kernels in {cc.output_dir}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
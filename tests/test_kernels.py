@@ -0,0 +1,228 @@
+"""
+Regression checks for the compiled kernels against the original pandas implementations
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from config import Config
+from core.indicators import IndicatorEngine
+from core.kernels import score_confluence, CONFLUENCE_REASONS
+from core.signals import SignalEngine
+
+def make_bars(n: int, seed: int = 0, start: str = "2024-03-04 09:30") -> pd.DataFrame:
+    """Random-walk 1m NQ bars with a few zero and missing volumes"""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(start, periods=n, freq="1min", tz="America/New_York")
+    close = 18000 + np.cumsum(rng.normal(0, 2, n)).round(2)
+    spread = rng.uniform(0.25, 3, n)
+    volume = rng.integers(50, 500, n).astype(np.float64)
+    volume[rng.choice(n, n // 50, replace=False)] = 0
+    volume[rng.choice(n, n // 50, replace=False)] = np.nan
+    return pd.DataFrame({
+        "Open": close + rng.normal(0, 0.5, n),
+        "High": close + spread,
+        "Low": close - spread,
+        "Close": close,
+        "Volume": volume,
+    }, index=index)
+
+def as_float32(series: pd.Series) -> pd.Series:
+    """Round prices the way the kernels read them"""
+    return series.astype(np.float32).astype(np.float64)
+
+def ema(series: pd.Series, span: int) -> pd.Series:
+    return series.ewm(span=span, adjust=False).mean()
+
+def rsi(close: pd.Series, length: int = 14) -> pd.Series:
+    delta = close.diff()
+    up = delta.clip(lower=0).rolling(length).mean()
+    down = (-delta.clip(upper=0)).rolling(length).mean()
+    return 100 - (100 / (1 + up / down.replace(0, np.nan)))
+
+def reference_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    """Baseline pandas indicators, with session VWAP and the VolAvg20 volume baseline"""
+    high, low, close = as_float32(df["High"]), as_float32(df["Low"]), as_float32(df["Close"])
+    ref = pd.DataFrame(index=df.index)
+    ref["EMA9"] = ema(close, 9)
+    ref["EMA21"] = ema(close, 21)
+    ref["EMA50"] = ema(close, 50)
+    ref["MACD"] = ema(close, 12) - ema(close, 26)
+    ref["MACDsig"] = ema(ref["MACD"], 9)
+    ref["MACDhist"] = ref["MACD"] - ref["MACDsig"]
+    ref["RSI14"] = rsi(close)
+    lowest, highest = low.rolling(14).min(), high.rolling(14).max()
+    ref["StochK"] = 100 * (close - lowest) / (highest - lowest).replace(0, np.nan)
+    ref["StochD"] = ref["StochK"].rolling(3).mean()
+    ref["BBmid"] = close.rolling(20).mean()
+    std = close.rolling(20).std(ddof=0)
+    ref["BBup"] = ref["BBmid"] + 2.0 * std
+    ref["BBlo"] = ref["BBmid"] - 2.0 * std
+
+    volume = df["Volume"].where(df["Volume"] > 0, 0.0)
+    pv = (high + low + close) / 3.0 * volume
+    session = df.index.tz_localize(None).normalize()
+    ref["VWAP"] = pv.groupby(session).cumsum() / volume.groupby(session).cumsum().replace(0, np.nan)
+    ref["VolAvg20"] = df["Volume"].rolling(20, min_periods=1).mean()
+    return ref
+
+def reference_timeframes(df: pd.DataFrame) -> dict:
+    """Baseline pandas resample and higher timeframe indicators"""
+    frames = {}
+    for tf_name, tf_rule in SignalEngine.TIMEFRAMES.items():
+        bars = df.resample(tf_rule).agg(SignalEngine.AGG_RULES).dropna().astype(np.float32)
+        close = bars["Close"].astype(np.float64)
+        ref = bars.astype(np.float64)
+        ref["EMA9"] = ema(close, 9)
+        ref["EMA21"] = ema(close, 21)
+        ref["EMA50"] = ema(close, 50)
+        ref["MACD"] = ema(close, 12) - ema(close, 26)
+        ref["MACDsig"] = ema(ref["MACD"], 9)
+        ref["RSI14"] = rsi(close)
+        ref["BBmid"] = close.rolling(20).mean()
+        std = close.rolling(20).std(ddof=0)
+        ref["BBup"] = ref["BBmid"] + 2.0 * std
+        ref["BBlo"] = ref["BBmid"] - 2.0 * std
+        frames[tf_name] = ref
+    return frames
+
+def reference_confluence(row: dict, or_low, or_high, or_ready: bool, htf_bias: dict):
+    """Baseline confluence_analysis scoring for one 1m row and higher timeframe biases"""
+    score = 50
+    reasons = []
+
+    for tf, weight in [("4h", 15), ("60m", 10), ("15m", 8)]:
+        if htf_bias[tf] > 0:
+            score += weight
+            reasons.append(f"{tf} bearish trend")
+        elif htf_bias[tf] < 0:
+            score -= weight * 0.7
+            reasons.append(f"{tf} bullish trend")
+
+    if row["Close"] < row["EMA9"] < row["EMA21"] < row["EMA50"]:
+        score += 8
+        reasons.append("Complete bear EMA stack")
+    elif row["EMA9"] < row["EMA21"] < row["EMA50"]:
+        score += 4
+        reasons.append("Partial bear EMA stack")
+
+    if row["MACD"] < row["MACDsig"] and row["MACDhist"] < 0:
+        score += 5
+        reasons.append("MACD bearish momentum")
+
+    if row["RSI14"] >= 70:
+        score += 6
+        reasons.append("RSI overbought (>70)")
+    elif row["RSI14"] >= 60:
+        score += 3
+        reasons.append("RSI elevated (>60)")
+    elif row["RSI14"] <= 30:
+        score -= 4
+        reasons.append("RSI oversold (<30)")
+
+    if row["Close"] > row["BBup"]:
+        score += 6
+        reasons.append("Price above upper Bollinger Band")
+    elif row["Close"] < row["BBlo"]:
+        score -= 3
+        reasons.append("Price below lower Bollinger Band")
+
+    if not np.isnan(row["VWAP"]):
+        if row["Close"] < row["VWAP"]:
+            score += 4
+            reasons.append("Below session VWAP")
+        else:
+            score -= 2
+            reasons.append("Above session VWAP")
+
+    if or_ready and or_low is not None and row["Close"] < or_low:
+        score += 8
+        reasons.append("Opening Range low break")
+    elif or_ready and or_high is not None and row["Close"] > or_high:
+        score -= 5
+        reasons.append("Opening Range high break")
+
+    if row["StochK"] < row["StochD"] and row["StochK"] > 80:
+        score += 4
+        reasons.append("Stochastic bear cross from overbought")
+
+    if row["Volume"] > row["VolAvg20"] * 1.5 and score > 50:
+        score += 3
+        reasons.append("High volume confirms bear signal")
+
+    return max(0, min(100, int(score))), reasons
+
+def assert_frames_close(actual: pd.DataFrame, expected: pd.DataFrame, rtol: float):
+    pd.testing.assert_index_equal(actual.index, expected.index)
+    for col in expected.columns:
+        np.testing.assert_allclose(actual[col].to_numpy(dtype=np.float64), expected[col].to_numpy(dtype=np.float64),
+                                   rtol=rtol, atol=1e-6, err_msg=col)
+
+def test_compute_all_matches_pandas():
+    df = make_bars(3 * 1440 + 17)
+    result = IndicatorEngine(Config()).compute_indicators(df)
+    assert_frames_close(result, reference_indicators(df), rtol=1e-9)
+
+def test_update_indicators_matches_full_compute():
+    df = make_bars(600, seed=1)
+    engine = IndicatorEngine(Config())
+    full = IndicatorEngine(Config())
+
+    steps = [df.iloc[:400], df.iloc[:401], df.iloc[:450]]
+    revised = df.iloc[:450].copy()
+    revised.iloc[-1, revised.columns.get_loc("Close")] += 1.25
+    steps += [revised, df.iloc[:430], df]
+    for step in steps:
+        assert_frames_close(engine.update_indicators(step), full.compute_indicators(step), rtol=1e-9)
+
+def test_score_confluence_matches_baseline():
+    rng = np.random.default_rng(2)
+    columns = ["Close", "EMA9", "EMA21", "EMA50", "MACD", "MACDsig", "MACDhist", "RSI14",
+               "BBup", "BBlo", "VWAP", "StochK", "StochD", "Volume", "VolAvg20"]
+    for _ in range(2000):
+        row = dict(zip(columns, rng.normal(100, 2, len(columns))))
+        row["MACDhist"] = row["MACD"] - row["MACDsig"]
+        row["RSI14"] = rng.uniform(0, 100)
+        row["StochK"], row["StochD"] = rng.uniform(0, 100, 2)
+        row["Volume"], row["VolAvg20"] = rng.uniform(0, 400, 2)
+        for col in rng.choice(columns, rng.integers(0, 3), replace=False):
+            row[col] = np.nan
+        or_low, or_high = (None if rng.random() < 0.2 else rng.normal(100, 2) for _ in range(2))
+        or_ready = bool(rng.random() < 0.7)
+        htf_bias = dict(zip(("4h", "60m", "15m"), rng.integers(-1, 2, 3)))
+
+        score, flags = score_confluence(
+            *(row[col] for col in columns[:13]),
+            np.nan if or_low is None else or_low, np.nan if or_high is None else or_high,
+            or_ready, row["Volume"], row["VolAvg20"],
+            htf_bias["4h"], htf_bias["60m"], htf_bias["15m"],
+        )
+        reasons = [reason for bit, reason in enumerate(CONFLUENCE_REASONS) if flags >> bit & 1]
+        assert (score, reasons) == reference_confluence(row, or_low, or_high, or_ready, htf_bias)
+
+def test_create_timeframes_matches_resample():
+    df = make_bars(2 * 1440, seed=3)
+    frames = SignalEngine(Config())._create_timeframes(df)
+    for tf_name, expected in reference_timeframes(df).items():
+        assert_frames_close(frames[tf_name], expected, rtol=1e-5)
+
+@pytest.mark.parametrize("seed", [4, 5])
+def test_incremental_timeframes_match_full_rebuild(seed):
+    bars = make_bars(1440 + 300, seed=seed)
+
+    # Overnight gap: the second session opens after a missing stretch of minutes
+    df = pd.concat([bars.iloc[:700], bars.iloc[900:]])
+    revised = df.iloc[:1200].copy()
+    revised.iloc[-3:, revised.columns.get_loc("Close")] -= 2.5
+    steps = [df.iloc[:500], df.iloc[:501], df.iloc[:760], revised, df.iloc[:1150], df.iloc[:1100], df]
+
+    engine = SignalEngine(Config())
+    for step in steps:
+        frames = engine._create_timeframes(step)
+        rebuilt = SignalEngine(Config())._create_timeframes(step)
+        assert set(frames) == set(rebuilt)
+        for tf_name in SignalEngine.TIMEFRAMES:
+            assert_frames_close(frames[tf_name], rebuilt[tf_name], rtol=1e-6)
+        for tf_name, expected in reference_timeframes(step).items():
+            assert_frames_close(frames[tf_name], expected, rtol=1e-5)
\ No newline at end of file
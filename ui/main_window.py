@@ -2,6 +2,7 @@
 Main application window with Bloomberg-style dark theme
 """
 
+import logging
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
@@ -10,10 +11,16 @@ from typing import Dict, Any
 from .panels import *
 from .styles import get_dark_theme_stylesheet
 from .region_selector import RegionSelector
+from core.runtime import shutdown_pool
+
+logger = logging.getLogger(__name__)
 
 class MainWindow(QMainWindow):
     """Main application window"""
     
+    # Panels update from engine signals; this full refresh is only a safety net
+    SAFETY_REFRESH_MS = 30000
+    
     def __init__(self, engine, config):
         super().__init__()
         self.engine = engine
@@ -28,6 +35,11 @@ class MainWindow(QMainWindow):
         # Initialize components
         self.region_selector = RegionSelector()
         self.setup_ui()
+        self.panels = [self.price_panel, self.confluence_panel, self.chart_panel,
+                       self.history_panel, self.news_panel]
+        self._dirty_panels = set()
+        self._snapshot: Dict = {}  # Last snapshot handed to the panels
+        self._status_source = None  # Source the status labels are styled for
         self.setup_connections()
         self.setup_timers()
         
@@ -178,10 +190,15 @@ class MainWindow(QMainWindow):
     
     def setup_timers(self):
         """Setup update timers"""
-        # Main update timer
+        # Safety-net full refresh
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_all_panels)
-        self.update_timer.start(self.config.auto_refresh_ms)
+        self.update_timer.start(self.SAFETY_REFRESH_MS)
+        
+        # Coalesces engine signals arriving together into one refresh
+        self.refresh_timer = QTimer()
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.timeout.connect(self.refresh_dirty_panels)
         
         # Status update timer
         self.status_timer = QTimer()
@@ -190,16 +207,30 @@ class MainWindow(QMainWindow):
     
     def update_all_panels(self):
         """Update all panels with latest data"""
+        self._dirty_panels.clear()
+        self._refresh_panels(self.panels)
+    
+    def schedule_refresh(self, *panels):
+        """Mark panels for the next coalesced refresh"""
+        self._dirty_panels.update(panels)
+        if not self.refresh_timer.isActive():
+            self.refresh_timer.start(0)
+    
+    def refresh_dirty_panels(self):
+        """Refresh the panels marked since the last refresh"""
+        panels = [panel for panel in self.panels if panel in self._dirty_panels]
+        self._dirty_panels.clear()
+        self._refresh_panels(panels)
+    
+    def _refresh_panels(self, panels):
+        """Update panels from a single engine snapshot"""
         try:
-            # Update each panel
-            self.price_panel.update_data()
-            self.confluence_panel.update_data()
-            self.chart_panel.update_data()
-            self.history_panel.update_data()
-            self.news_panel.update_data()
+            self._snapshot = snapshot = self.engine.get_snapshot()
+            for panel in panels:
+                panel.update_data(snapshot)
             
-        except Exception as e:
-            print(f"Error updating panels: {e}")
+        except Exception:
+            logger.exception("Error updating panels")
     
     def update_status(self):
         """Update status bar"""
@@ -209,9 +240,13 @@ class MainWindow(QMainWindow):
         current_time = datetime.now().strftime("%H:%M:%S")
         self.last_update_label.setText(f"Last Update: {current_time}")
         
-        # Update connection status
-        data = self.engine.get_current_data()
-        source = data.get("source", "NONE")
+        # Update connection status from the snapshot the panels last rendered
+        source = self._snapshot.get("source", "NONE")
+        
+        # Restyling the labels re-parses their stylesheets, so only do it on a change
+        if source == self._status_source:
+            return
+        self._status_source = source
         
         if source == "OCR":
             self.connection_label.setText("Connected (Live OCR)")
@@ -232,19 +267,20 @@ class MainWindow(QMainWindow):
     # Event handlers
     def on_price_updated(self, price: float, source: str):
         """Handle price update"""
-        pass  # Panels will update themselves
+        # Indicator readouts and the chart follow the price
+        self.schedule_refresh(self.price_panel, self.chart_panel)
     
     def on_signal_updated(self, bias: str, confidence: int, reasons: list):
         """Handle signal update"""
-        pass  # Panels will update themselves
+        self.schedule_refresh(self.price_panel, self.history_panel)
     
     def on_confluence_updated(self, score: int, reasons: list):
         """Handle confluence update"""
-        pass  # Panels will update themselves
+        self.schedule_refresh(self.confluence_panel)
     
-    def on_news_updated(self, news_items: list):
+    def on_news_updated(self, news_items: tuple):
         """Handle news update"""
-        pass  # Panels will update themselves
+        self.schedule_refresh(self.news_panel)
     
     def on_error_occurred(self, error_msg: str):
         """Handle error"""
@@ -289,4 +325,5 @@ class MainWindow(QMainWindow):
         """Handle application close"""
         self.engine.stop()
         self.config.save()
+        shutdown_pool()
         event.accept()
\ No newline at end of file
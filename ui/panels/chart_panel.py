@@ -2,22 +2,49 @@
 Chart Panel - Simple price chart with signal markers
 """
 
+import logging
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.dates as mdates
-from datetime import datetime
-import pandas as pd
+import numpy as np
+from typing import Dict, Optional
 
-# Set matplotlib to use dark theme
-plt.style.use('dark_background')
+# pyqtgraph is optional; without it the chart renders through matplotlib
+try:
+    import pyqtgraph as pg
+except ImportError:
+    pg = None
+
+logger = logging.getLogger(__name__)
+
+def downsample_peaks(x: np.ndarray, y: np.ndarray, n_buckets: int):
+    """Reduce a series to the min and max point of each of n_buckets equal x-order buckets
+    
+    The polyline keeps its visual envelope with at most 2 * n_buckets
+    vertices; NaN gaps survive as long as a bucket holds nothing else.
+    """
+    if len(x) <= 2 * n_buckets:
+        return x, y
+    
+    size = -(-len(y) // n_buckets)
+    padded = np.full(size * n_buckets, np.nan)
+    padded[:len(y)] = y
+    buckets = padded.reshape(n_buckets, size)
+    finite = ~np.isnan(buckets)
+    
+    starts = np.arange(n_buckets) * size
+    lows = starts + np.where(finite, buckets, np.inf).argmin(axis=1)
+    highs = starts + np.where(finite, buckets, -np.inf).argmax(axis=1)
+    keep = np.unique(np.concatenate([lows, highs]))
+    keep = keep[keep < len(y)]
+    return x[keep], y[keep]
 
 class ChartPanel(QFrame):
     """Panel displaying price chart with signal markers"""
     
+    # Signal marker colors; anything else is neutral amber
+    SIGNAL_COLORS = {"BULLISH": '#4CAF50', "BEARISH": '#F44336'}
+    
     def __init__(self, engine, config):
         super().__init__()
         self.engine = engine
@@ -28,7 +55,13 @@ class ChartPanel(QFrame):
         
         # Chart data tracking
         self.last_signal = None
-        self.signal_markers = []
+        self._title = None
+        
+        # Redraws are throttled to chart_refresh_ms and only draw the latest snapshot
+        self._pending_data: Optional[Dict] = None
+        self._paint_timer = QTimer(self)
+        self._paint_timer.setSingleShot(True)
+        self._paint_timer.timeout.connect(self._do_repaint)
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -56,10 +89,45 @@ class ChartPanel(QFrame):
         
         # Chart
         self.setup_chart()
-        layout.addWidget(self.canvas)
+        layout.addWidget(self.plot if pg is not None else self.canvas)
         
     def setup_chart(self):
-        """Setup matplotlib chart"""
+        """Setup the chart, with one persistent curve per series"""
+        if pg is None:
+            self._setup_matplotlib_chart()
+            return
+        
+        # Bars are plotted at their wall-clock time in the index's timezone
+        date_axis = pg.DateAxisItem(orientation='bottom', utcOffset=0)
+        self.plot = pg.PlotWidget(background='#1E1E1E', axisItems={'bottom': date_axis})
+        self.plot.showGrid(x=True, y=True, alpha=0.3)
+        
+        # Draw only visible bars, decimated to the plot's pixel width by min/max peaks
+        self.plot.setDownsampling(auto=True, mode='peak')
+        self.plot.setClipToView(True)
+        for axis in ('bottom', 'left'):
+            self.plot.getAxis(axis).setTextPen('#E0E0E0')
+        
+        self.plot.addLegend(offset=(10, 10), labelTextColor='#E0E0E0', brush='#2D2D2D', pen='#404040')
+        self.price_curve = self.plot.plot(pen=pg.mkPen('#2196F3', width=1.5), name='NQ Price')
+        self.ema9_curve = self.plot.plot(pen=pg.mkPen('#FF9800', width=1), name='EMA 9')
+        self.ema21_curve = self.plot.plot(pen=pg.mkPen('#4CAF50', width=1), name='EMA 21')
+        self.vwap_curve = self.plot.plot(pen=pg.mkPen('#9C27B0', width=1, style=Qt.DashLine), name='VWAP')
+        
+        self.signal_scatter = pg.ScatterPlotItem(size=8, pen=None)
+        self.plot.addItem(self.signal_scatter)
+        
+    def _setup_matplotlib_chart(self):
+        """Setup matplotlib chart with persistent artists, redrawn by blitting"""
+        # matplotlib is only imported when the chart falls back to it
+        import matplotlib.style
+        import matplotlib.dates as mdates
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        
+        # Set matplotlib to use dark theme
+        matplotlib.style.use('dark_background')
+        
         self.figure = Figure(figsize=(10, 6), facecolor='#1E1E1E')
         self.canvas = FigureCanvas(self.figure)
         self.canvas.setStyleSheet("background-color: #1E1E1E;")
@@ -68,113 +136,195 @@ class ChartPanel(QFrame):
         self.ax = self.figure.add_subplot(111, facecolor='#1E1E1E')
         
         # Style the axes
-        self.ax.tick_params(colors='#E0E0E0', which='both')
+        self.ax.tick_params(colors='#E0E0E0', which='both', labelsize=8)
+        self.ax.tick_params(axis='x', labelrotation=30)
         self.ax.xaxis.label.set_color('#E0E0E0')
         self.ax.yaxis.label.set_color('#E0E0E0')
-        self.ax.title.set_color('#E0E0E0')
+        self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
+        self._locator_bars = 0
         
         # Grid
-        self.ax.grid(True, alpha=0.3, color='#404040')
+        self.ax.grid(True, alpha=0.2, color='#404040')
         
         # Tight layout
         self.figure.tight_layout()
         
-        # Initialize empty plot
-        self.price_line, = self.ax.plot([], [], color='#2196F3', linewidth=1.5, label='NQ Price')
-        self.ax.legend(loc='upper left', fancybox=True, framealpha=0.9)
+        # Series, signal marker and title change every update and are blitted over a cached background
+        self.price_line, = self.ax.plot([], [], color='#2196F3', linewidth=1.5, label='NQ Price', animated=True)
+        self.ema9_line, = self.ax.plot([], [], color='#FF9800', linewidth=1, alpha=0.8, label='EMA 9', animated=True)
+        self.ema21_line, = self.ax.plot([], [], color='#4CAF50', linewidth=1, alpha=0.8, label='EMA 21', animated=True)
+        self.vwap_line, = self.ax.plot([], [], color='#9C27B0', linewidth=1, alpha=0.8, linestyle='--',
+                                       label='VWAP', animated=True)
+        self.signal_scatter = self.ax.scatter([], [], s=50, alpha=0.8, zorder=5, animated=True)
+        self.ax.title.set_color('#E0E0E0')
+        self.ax.title.set_fontsize(10)
+        self.ax.title.set_animated(True)
+        self._animated_artists = (self.price_line, self.ema9_line, self.ema21_line, self.vwap_line,
+                                  self.signal_scatter, self.ax.title)
+        
+        # Legend
+        legend = self.ax.legend(loc='upper left', fancybox=True, framealpha=0.9, fontsize=8)
+        legend.get_frame().set_facecolor('#2D2D2D')
+        legend.get_frame().set_edgecolor('#404040')
+        for text in legend.get_texts():
+            text.set_color('#E0E0E0')
+        
+        self.no_data_text = self.ax.text(0.5, 0.5, 'No Data Available\nWaiting for price feed...',
+                                         horizontalalignment='center', verticalalignment='center',
+                                         transform=self.ax.transAxes, color='#B0B0B0', fontsize=12,
+                                         visible=False)
+        
+        # Every full draw (first show, resize, rescale) refreshes the blit background
+        self._background = None
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
+        
+    def _on_canvas_draw(self, event):
+        """Cache the static background and paint the animated artists over it"""
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_animated()
+    
+    def _request_draw(self):
+        """Queue a full draw for the next event-loop pass
+        
+        draw_idle coalesces with any draw already queued. The cached background
+        is stale from here until that draw's draw_event, so blitting is off
+        until then.
+        """
+        self._background = None
+        self.canvas.draw_idle()
+    
+    def _draw_animated(self):
+        """Draw the artists that change between updates"""
+        for artist in self._animated_artists:
+            self.ax.draw_artist(artist)
+        
+
+    def update_data(self, current_data: Dict):
+        """Queue a chart update from an engine snapshot"""
+        self._pending_data = current_data
+        if not self._paint_timer.isActive():
+            self._paint_timer.start(self.config.chart_refresh_ms)
+    
+    def _do_repaint(self):
+        """Draw the most recent queued snapshot"""
+        current_data, self._pending_data = self._pending_data, None
+        if current_data is None:
+            return
         
-    def update_data(self):
-        """Update chart with latest data"""
         try:
-            # Get current data from engine
-            current_data = self.engine.get_current_data()
-            
-            # Get price history from engine dataframe
-            if hasattr(self.engine, 'df') and not self.engine.df.empty:
-                df = self.engine.df.copy()
-                
-                # Limit to last 100 bars for performance
-                if len(df) > 100:
-                    df = df.tail(100)
-                
-                if len(df) > 0:
-                    self._plot_price_data(df, current_data)
+            # Last 100 bars and indicators as views of the engine's incremental state,
+            # taken with the snapshot the signal panels show
+            series = current_data.get('indicator_buffers')
+            if series is None:
+                series = self.engine.get_indicator_buffers(100)
+            if len(series['index']) > 0:
+                self._plot_price_data(series, current_data)
             else:
                 self._plot_no_data()
                 
-        except Exception as e:
-            print(f"Error updating chart: {e}")
+        except Exception:
+            logger.exception("Error updating chart")
             self._plot_no_data()
     
-    def _plot_price_data(self, df, current_data):
-        """Plot price data with indicators"""
-        self.ax.clear()
-        
-        # Plot price line
-        timestamps = df.index
-        prices = df['Close']
-        
-        self.ax.plot(timestamps, prices, color='#2196F3', linewidth=1.5, label='NQ Price')
-        
-        # Add EMA lines if available
-        indicators_df = self.engine.indicator_engine.compute_indicators(df)
-        if not indicators_df.empty and 'EMA9' in indicators_df.columns:
-            if not indicators_df['EMA9'].isna().all():
-                self.ax.plot(timestamps, indicators_df['EMA9'], color='#FF9800', 
-                           linewidth=1, alpha=0.8, label='EMA 9')
-            
-            if not indicators_df['EMA21'].isna().all():
-                self.ax.plot(timestamps, indicators_df['EMA21'], color='#4CAF50', 
-                           linewidth=1, alpha=0.8, label='EMA 21')
-        
-        # Add VWAP if available
-        if 'VWAP' in indicators_df.columns and not indicators_df['VWAP'].isna().all():
-            self.ax.plot(timestamps, indicators_df['VWAP'], color='#9C27B0', 
-                        linewidth=1, alpha=0.8, linestyle='--', label='VWAP')
-        
-        # Add signal markers (future enhancement)
+    def _plot_price_data(self, series, current_data):
+        """Plot price data with indicators from index, Close and indicator arrays"""
+        if pg is None:
+            self._plot_matplotlib(series, current_data)
+            return
+        
+        # Epoch seconds of each bar's wall-clock time, for the date axis
+        index = series['index'].tz_localize(None) if series['index'].tz is not None else series['index']
+        x = index.values.astype('datetime64[ns]').view(np.int64) / 1e9
+        prices = np.asarray(series['Close'], dtype=np.float64)
+        self.price_curve.setData(x, prices, connect='finite')
+        
+        # Indicator curves stay empty until there are enough bars for them
+        for curve, column in ((self.ema9_curve, 'EMA9'), (self.ema21_curve, 'EMA21'), (self.vwap_curve, 'VWAP')):
+            if column in series:
+                curve.setData(x, np.asarray(series[column], dtype=np.float64), connect='finite')
+            else:
+                curve.setData([], [])
+        
+        # Mark signal changes
         current_signal = current_data.get('bias', 'NEUTRAL')
-        if current_signal != self.last_signal and len(timestamps) > 0:
-            # Mark signal change
-            marker_color = '#4CAF50' if current_signal == 'BULLISH' else '#F44336' if current_signal == 'BEARISH' else '#FFC107'
-            self.ax.scatter([timestamps.iloc[-1]], [prices.iloc[-1]], 
-                          c=marker_color, s=50, alpha=0.8, zorder=5)
+        if current_signal != self.last_signal:
+            marker_color = self.SIGNAL_COLORS.get(current_signal, '#FFC107')
+            self.signal_scatter.setData([x[-1]], [prices[-1]], brush=marker_color)
             self.last_signal = current_signal
         
-        # Formatting
-        self.ax.set_title(f'NQ Futures - Last: {current_data.get("price", 0):.2f}', 
-                         color='#E0E0E0', fontsize=10)
+        # Title text is the only per-tick formatting; lay it out again only when it changes
+        title = f'NQ Futures - Last: {current_data.get("price", 0):.2f}'
+        if title != self._title:
+            self.plot.setTitle(title, color='#E0E0E0', size='10pt')
+            self._title = title
+    
+    def _plot_matplotlib(self, series, current_data):
+        """Plot price data with indicators through matplotlib"""
+        import matplotlib.dates as mdates
         
-        # Format x-axis
-        if len(timestamps) > 20:
-            # Show fewer time labels for readability
-            self.ax.xaxis.set_major_locator(mdates.MinuteLocator(interval=max(1, len(timestamps)//10)))
+        # Bars are plotted at their wall-clock time in the index's timezone
+        index = series['index'].tz_localize(None) if series['index'].tz is not None else series['index']
+        x = mdates.date2num(index.values)
+        prices = np.asarray(series['Close'], dtype=np.float64)
+        # More bars than pixels are decimated by min/max peaks before they reach Agg
+        n_buckets = max(1, self.canvas.width() // 2)
+        self.price_line.set_data(*downsample_peaks(x, prices, n_buckets))
         
-        self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
+        # Indicator lines stay empty until there are enough bars for them
+        for line, column in ((self.ema9_line, 'EMA9'), (self.ema21_line, 'EMA21'), (self.vwap_line, 'VWAP')):
+            if column in series:
+                line.set_data(*downsample_peaks(x, np.asarray(series[column], dtype=np.float64), n_buckets))
+            else:
+                line.set_data([], [])
         
-        # Rotate time labels
-        self.figure.autofmt_xdate()
+        # Mark signal changes
+        current_signal = current_data.get('bias', 'NEUTRAL')
+        if current_signal != self.last_signal:
+            marker_color = self.SIGNAL_COLORS.get(current_signal, '#FFC107')
+            self.signal_scatter.set_offsets(np.array([[x[-1], prices[-1]]]))
+            self.signal_scatter.set_facecolor(marker_color)
+            self.last_signal = current_signal
         
-        # Style
-        self.ax.tick_params(colors='#E0E0E0', which='both', labelsize=8)
-        self.ax.grid(True, alpha=0.2, color='#404040')
-        self.ax.set_facecolor('#1E1E1E')
+        # Title text is the only per-tick formatting; legend, formatter and styling are set up once
+        title = f'NQ Futures - Last: {current_data.get("price", 0):.2f}'
+        if title != self._title:
+            self.ax.title.set_text(title)
+            self._title = title
         
-        # Legend
-        legend = self.ax.legend(loc='upper left', fancybox=True, framealpha=0.9, fontsize=8)
-        legend.get_frame().set_facecolor('#2D2D2D')
-        legend.get_frame().set_edgecolor('#404040')
-        for text in legend.get_texts():
-            text.set_color('#E0E0E0')
+        # Axes, ticks and legend only need a full draw when the view limits move
+        limits = (self.ax.get_xlim(), self.ax.get_ylim())
+        self.ax.relim()
+        self.ax.autoscale_view()
+        if (self._background is None or self.no_data_text.get_visible()
+                or limits != (self.ax.get_xlim(), self.ax.get_ylim())):
+            if len(x) > 20 and len(x) != self._locator_bars:
+                # Show fewer time labels for readability
+                self.ax.xaxis.set_major_locator(mdates.MinuteLocator(interval=max(1, len(x)//10)))
+                self._locator_bars = len(x)
+            self.no_data_text.set_visible(False)
+            self._request_draw()
+            return
         
-        # Refresh canvas
-        self.canvas.draw()
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.figure.bbox)
     
     def _plot_no_data(self):
         """Show no data available message"""
-        self.ax.clear()
-        self.ax.text(0.5, 0.5, 'No Data Available\nWaiting for price feed...', 
-                    horizontalalignment='center', verticalalignment='center',
-                    transform=self.ax.transAxes, color='#B0B0B0', fontsize=12)
-        self.ax.set_facecolor('#1E1E1E')
-        self.canvas.draw()
\ No newline at end of file
+        if pg is not None:
+            for curve in (self.price_curve, self.ema9_curve, self.ema21_curve, self.vwap_curve):
+                curve.setData([], [])
+            self.signal_scatter.clear()
+            self.last_signal = None
+            self.plot.setTitle('No Data Available - Waiting for price feed...', color='#B0B0B0', size='12pt')
+            self._title = None
+            return
+        
+        for line in (self.price_line, self.ema9_line, self.ema21_line, self.vwap_line):
+            line.set_data([], [])
+        self.signal_scatter.set_offsets(np.empty((0, 2)))
+        self.ax.title.set_text('')
+        self._title = None
+        self.last_signal = None
+        self.no_data_text.set_visible(True)
+        self._request_draw()
\ No newline at end of file
@@ -2,18 +2,56 @@
 Confluence Analysis Panel - Shows weighted signal analysis
 """
 
+import logging
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
+from typing import Dict, List, Optional, Tuple
+import re
+
+logger = logging.getLogger(__name__)
+
+# Reason coloring keywords, matched anywhere in the reason ("bear" also colors "bearish")
+BEAR_WORDS = re.compile(r"bear|short|down|below|break", re.IGNORECASE)
+BULL_WORDS = re.compile(r"bull|long|up|above|oversold", re.IGNORECASE)
+OVERBOUGHT_WORDS = re.compile(r"overbought|rsi>70", re.IGNORECASE)
+
+def _score_styles(color: str, chunk_color: str, interpretation: str) -> Tuple[str, str, str, str]:
+    """Score label, progress bar and interpretation styling for one score bucket"""
+    return (
+        f"font-size: 16pt; font-weight: bold; color: {color};",
+        f"QProgressBar::chunk {{ background-color: {chunk_color}; }}",
+        interpretation,
+        f"font-size: 11pt; font-weight: 600; color: {color}; padding: 4px;",
+    )
 
 class ConfluencePanel(QFrame):
     """Panel showing confluence analysis and reasoning"""
     
+    SCORE_BUCKETS = {
+        "strong_bear": _score_styles("#F44336", "#F44336", "STRONG BEARISH BIAS"),
+        "moderate_bear": _score_styles("#FF7043", "#FF7043", "MODERATE BEARISH"),
+        "neutral": _score_styles("#E0E0E0", "#1976D2", "NEUTRAL BIAS"),
+        "moderate_bull": _score_styles("#66BB6A", "#66BB6A", "MODERATE BULLISH"),
+        "strong_bull": _score_styles("#4CAF50", "#4CAF50", "STRONG BULLISH BIAS"),
+    }
+    
+    # Reason colors
+    BEAR_BRUSH = QBrush(QColor("#FF7043"))  # Orange for bearish
+    BULL_BRUSH = QBrush(QColor("#66BB6A"))  # Green for bullish
+    OVERBOUGHT_BRUSH = QBrush(QColor("#F44336"))  # Red for overbought
+    DEFAULT_BRUSH = QBrush(QColor("#E0E0E0"))
+    
     def __init__(self, engine, config):
         super().__init__()
         self.engine = engine
         self.config = config
         
+        # Last values shown, so unchanged updates skip restyling and HTML rebuilds
+        self._last_score: Optional[int] = None
+        self._last_bucket: Optional[str] = None
+        self._last_reasons: Optional[Tuple[str, ...]] = None
+        
         self.setProperty("class", "panel")
         self.setup_ui()
     
@@ -67,99 +105,96 @@ class ConfluencePanel(QFrame):
         layout.addWidget(reasoning_header)
         
         # Scrollable reasons list
-        self.reasons_widget = QTextEdit()
-        self.reasons_widget.setReadOnly(True)
+        self.reasons_widget = QListWidget()
+        self.reasons_widget.setSelectionMode(QAbstractItemView.NoSelection)
+        self.reasons_widget.setFocusPolicy(Qt.NoFocus)
         self.reasons_widget.setMaximumHeight(200)
         self.reasons_widget.setStyleSheet("""
-            QTextEdit {
+            QListWidget {
                 background-color: #252525;
                 border: 1px solid #404040;
                 border-radius: 4px;
                 padding: 8px;
                 font-size: 9pt;
-                line-height: 1.4;
+            }
+            QListWidget::item {
+                border: none;
+                padding: 2px 0px;
             }
         """)
         layout.addWidget(self.reasons_widget)
         
         layout.addStretch()
     
-    def update_data(self):
-        """Update panel with latest confluence analysis"""
+    def update_data(self, snapshot: Dict):
+        """Update panel from an engine snapshot"""
         try:
-            score, reasons = self.engine.get_confluence_analysis()
+            score = snapshot.get("confluence_score", 50)
+            reasons = tuple(snapshot.get("confluence_reasons", []))
             
             # Update score display
-            self.score_label.setText(f"{score}/100")
-            self.score_progress.setValue(score)
+            if score != self._last_score:
+                self.score_label.setText(f"{score}/100")
+                self.score_progress.setValue(score)
+                self._last_score = score
             
-            # Update score styling and interpretation
-            if score >= 70:
-                # Strong bearish
-                self.score_label.setStyleSheet("font-size: 16pt; font-weight: bold; color: #F44336;")
-                self.score_progress.setStyleSheet("QProgressBar::chunk { background-color: #F44336; }")
-                self.score_interpretation.setText("STRONG BEARISH BIAS")
-                self.score_interpretation.setStyleSheet("font-size: 11pt; font-weight: 600; color: #F44336; padding: 4px;")
-                
-            elif score >= 60:
-                # Moderate bearish
-                self.score_label.setStyleSheet("font-size: 16pt; font-weight: bold; color: #FF7043;")
-                self.score_progress.setStyleSheet("QProgressBar::chunk { background-color: #FF7043; }")
-                self.score_interpretation.setText("MODERATE BEARISH")
-                self.score_interpretation.setStyleSheet("font-size: 11pt; font-weight: 600; color: #FF7043; padding: 4px;")
-                
-            elif score <= 30:
-                # Strong bullish
-                self.score_label.setStyleSheet("font-size: 16pt; font-weight: bold; color: #4CAF50;")
-                self.score_progress.setStyleSheet("QProgressBar::chunk { background-color: #4CAF50; }")
-                self.score_interpretation.setText("STRONG BULLISH BIAS")
-                self.score_interpretation.setStyleSheet("font-size: 11pt; font-weight: 600; color: #4CAF50; padding: 4px;")
-                
-            elif score <= 40:
-                # Moderate bullish
-                self.score_label.setStyleSheet("font-size: 16pt; font-weight: bold; color: #66BB6A;")
-                self.score_progress.setStyleSheet("QProgressBar::chunk { background-color: #66BB6A; }")
-                self.score_interpretation.setText("MODERATE BULLISH")
-                self.score_interpretation.setStyleSheet("font-size: 11pt; font-weight: 600; color: #66BB6A; padding: 4px;")
-                
-            else:
-                # Neutral
-                self.score_label.setStyleSheet("font-size: 16pt; font-weight: bold; color: #E0E0E0;")
-                self.score_progress.setStyleSheet("QProgressBar::chunk { background-color: #1976D2; }")
-                self.score_interpretation.setText("NEUTRAL BIAS")
-                self.score_interpretation.setStyleSheet("font-size: 11pt; font-weight: 600; color: #E0E0E0; padding: 4px;")
+            # Restyle only when the score moves into another bucket
+            bucket = self._bucket(score)
+            if bucket != self._last_bucket:
+                label_style, progress_style, interpretation, interpretation_style = self.SCORE_BUCKETS[bucket]
+                self.score_label.setStyleSheet(label_style)
+                self.score_progress.setStyleSheet(progress_style)
+                self.score_interpretation.setText(interpretation)
+                self.score_interpretation.setStyleSheet(interpretation_style)
+                self._last_bucket = bucket
             
             # Update reasons
-            if reasons:
-                reasons_html = self._format_reasons_html(reasons)
-                self.reasons_widget.setHtml(reasons_html)
-            else:
-                self.reasons_widget.setPlainText("No confluence factors available")
+            if reasons != self._last_reasons:
+                if reasons:
+                    self._show_reasons([(f"• {reason}", self._reason_brush(reason)) for reason in reasons])
+                else:
+                    self._show_reasons([("No confluence factors available", self.DEFAULT_BRUSH)])
+                self._last_reasons = reasons
                 
         except Exception as e:
-            print(f"Error updating confluence panel: {e}")
+            logger.exception("Error updating confluence panel")
             self.score_label.setText("--/100")
-            self.reasons_widget.setPlainText(f"Error: {e}")
+            self._show_reasons([(f"Error: {e}", self.DEFAULT_BRUSH)])
+            self._last_score = self._last_bucket = self._last_reasons = None
     
-    def _format_reasons_html(self, reasons):
-        """Format reasons as HTML for better display"""
-        html = "<div style='color: #E0E0E0; line-height: 1.5;'>"
-        
-        for i, reason in enumerate(reasons, 1):
-            # Color code based on keywords
-            color = "#E0E0E0"  # Default
-            
-            reason_lower = reason.lower()
-            if any(word in reason_lower for word in ["bear", "short", "down", "below", "break"]):
-                color = "#FF7043"  # Orange for bearish
-            elif any(word in reason_lower for word in ["bull", "long", "up", "above", "oversold"]):
-                color = "#66BB6A"  # Green for bullish
-            elif "overbought" in reason_lower or "rsi>70" in reason_lower:
-                color = "#F44336"  # Red for overbought
-            
-            html += f"<div style='margin: 2px 0; color: {color};'>"
-            html += f"<span style='color: #B0B0B0;'>•</span> {reason}"
-            html += "</div>"
+    def _show_reasons(self, entries: List[Tuple[str, QBrush]]):
+        """Show (text, brush) rows, keeping the rows that already match"""
+        widget = self.reasons_widget
+        keep = 0
+        while (keep < min(len(entries), widget.count())
+               and widget.item(keep).text() == entries[keep][0]):
+            keep += 1
         
-        html += "</div>"
-        return html
\ No newline at end of file
+        while widget.count() > keep:
+            widget.takeItem(widget.count() - 1)
+        for text, brush in entries[keep:]:
+            item = QListWidgetItem(text)
+            item.setForeground(brush)
+            widget.addItem(item)
+    
+    def _reason_brush(self, reason: str) -> QBrush:
+        """Color code a reason based on keywords"""
+        if BEAR_WORDS.search(reason):
+            return self.BEAR_BRUSH
+        if BULL_WORDS.search(reason):
+            return self.BULL_BRUSH
+        if OVERBOUGHT_WORDS.search(reason):
+            return self.OVERBOUGHT_BRUSH
+        return self.DEFAULT_BRUSH
+    
+    def _bucket(self, score: int) -> str:
+        """SCORE_BUCKETS key for a confluence score"""
+        if score >= 70:
+            return "strong_bear"
+        if score >= 60:
+            return "moderate_bear"
+        if score <= 30:
+            return "strong_bull"
+        if score <= 40:
+            return "moderate_bull"
+        return "neutral"
\ No newline at end of file
@@ -2,10 +2,167 @@
 News Panel - Market news feed and sentiment analysis
 """
 
+import logging
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
 from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+def impact_tag(impact: str) -> str:
+    """Get short impact tag"""
+    if "High" in impact:
+        return "HIGH"
+    elif "Medium" in impact:
+        return "MED"
+    else:
+        return "LOW"
+
+class NewsTableModel(QAbstractTableModel):
+    """Rows of the news table, updated in place so only changed rows repaint"""
+    
+    HEADERS = ("Time", "Impact", "Event")
+    TIME_CACHE_SIZE = 256
+    
+    # Impact cell (foreground, background) by impact tag
+    IMPACT_COLORS = {
+        "HIGH": (QBrush(QColor("#F44336")), QBrush(QColor("#FFEBEE"))),
+        "MED": (QBrush(QColor("#FF9800")), QBrush(QColor("#FFF3E0"))),
+        "LOW": (QBrush(QColor("#4CAF50")), QBrush(QColor("#E8F5E8"))),
+    }
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # (time, impact tag, shortened title, full title) per row
+        self._rows: List[Tuple[str, str, str, str]] = []
+        
+        # ("%H:%M", "%m/%d") per event time; the same events repeat across refreshes
+        self._time_strs: Dict[datetime, Tuple[str, str]] = {}
+    
+    def set_items(self, news_items):
+        """Show news items, signalling only the rows whose display changed"""
+        now = datetime.now()
+        rows = [self._display_row(item, now, now.date()) for item in news_items]
+        if len(rows) != len(self._rows):
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+            return
+        
+        old_rows, self._rows = self._rows, rows
+        for row, (old, new) in enumerate(zip(old_rows, rows)):
+            if old != new:
+                self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+    
+    def _display_row(self, item: Dict, now: datetime, today) -> Tuple[str, str, str, str]:
+        """Display strings for one news item"""
+        # Time
+        item_time = item.get("time", now)
+        if isinstance(item_time, datetime):
+            time_strs = self._time_strs.get(item_time)
+            if time_strs is None:
+                if len(self._time_strs) >= self.TIME_CACHE_SIZE:
+                    self._time_strs.clear()
+                time_strs = self._time_strs[item_time] = (item_time.strftime("%H:%M"), item_time.strftime("%m/%d"))
+            
+            # Show date if not today
+            time_str = time_strs[0] if item_time.date() == today else time_strs[1]
+        else:
+            time_str = "--:--"
+        
+        # Event title, full title in tooltip
+        full_title = item.get("title", "")
+        title = full_title[:60] + "..." if len(full_title) > 60 else full_title
+        
+        return time_str, impact_tag(item.get("impact", "")), title, full_title
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        time_str, tag, title, full_title = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            return (time_str, tag, title)[column]
+        if role == Qt.TextAlignmentRole and column < 2:
+            return Qt.AlignCenter
+        if role == Qt.ForegroundRole and column == 1:
+            return self.IMPACT_COLORS[tag][0]
+        if role == Qt.BackgroundRole and column == 1:
+            return self.IMPACT_COLORS[tag][1]
+        if role == Qt.ToolTipRole and column == 2:
+            return full_title
+        return None
+
+class NewsTicker(QWidget):
+    """Scrolling news ticker; the text is laid out once and the label is panned across a clip"""
+    
+    SCROLL_MIN_CHARS = 50  # Shorter text is shown static
+    SEPARATOR = " • "
+    
+    def __init__(self, text: str, chars_per_sec: float, parent=None):
+        super().__init__(parent)
+        self.chars_per_sec = chars_per_sec
+        self.text = text
+        
+        # Child widgets are clipped to this widget, so panning the label scrolls it;
+        # the label opts out of the ticker frame's QFrame padding
+        self.label = QLabel(self)
+        self.label.setStyleSheet("color: #FFFFFF; font-size: 9pt; font-weight: 500; padding: 0px; background: transparent;")
+        
+        self.animation = QPropertyAnimation(self.label, b"pos", self)
+        self.animation.setLoopCount(-1)
+        
+        self.setText(text)
+    
+    def setText(self, text: str):
+        """Show new ticker text, restarting the scroll"""
+        self.text = text
+        self._restart()
+    
+    def sizeHint(self):
+        return QSize(super().sizeHint().width(), self.label.sizeHint().height())
+    
+    def minimumSizeHint(self):
+        return QSize(0, self.label.sizeHint().height())
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._restart()
+    
+    def _restart(self):
+        """Lay the text out and pan it one copy to the left, forever"""
+        self.animation.stop()
+        scrolling = len(self.text) > self.SCROLL_MIN_CHARS
+        
+        # Two copies back to back, so the loop restarts on an identical frame
+        loop_text = self.text + self.SEPARATOR if scrolling else ""
+        self.label.setText(loop_text + self.text)
+        self.label.ensurePolished()
+        self.label.adjustSize()
+        
+        y = (self.height() - self.label.height()) // 2
+        if not scrolling:
+            self.label.move(0, y)
+            return
+        
+        self.animation.setStartValue(QPoint(0, y))
+        self.animation.setEndValue(QPoint(-self.label.fontMetrics().horizontalAdvance(loop_text), y))
+        self.animation.setDuration(int(1000 * len(loop_text) / self.chars_per_sec))
+        self.animation.start()
 
 class NewsPanel(QFrame):
     """Panel displaying news feed and market sentiment"""
@@ -16,15 +173,14 @@ class NewsPanel(QFrame):
         self.config = config
         
         self.setProperty("class", "panel")
-        self.ticker_position = 0
         self.ticker_text = "Loading news feed..."
         
-        self.setup_ui()
+        # Last news tuple and sentiment shown; the feed publishes a new tuple only when items change
+        self._last_news = None
+        self._last_news_day = None
+        self._last_sentiment = None
         
-        # Ticker animation timer
-        self.ticker_timer = QTimer()
-        self.ticker_timer.timeout.connect(self.update_ticker)
-        self.ticker_timer.start(100)  # Update ticker every 100ms
+        self.setup_ui()
     
     def setup_ui(self):
         """Setup the user interface"""
@@ -51,9 +207,8 @@ class NewsPanel(QFrame):
         ticker_layout = QHBoxLayout(ticker_frame)
         ticker_layout.setContentsMargins(8, 0, 8, 0)
         
-        self.ticker_label = QLabel(self.ticker_text)
-        self.ticker_label.setStyleSheet("color: #FFFFFF; font-size: 9pt; font-weight: 500;")
-        ticker_layout.addWidget(self.ticker_label)
+        self.ticker = NewsTicker(self.ticker_text, self.config.ticker_speed_chars_per_sec)
+        ticker_layout.addWidget(self.ticker)
         
         layout.addWidget(ticker_frame)
         
@@ -73,9 +228,9 @@ class NewsPanel(QFrame):
         layout.addWidget(sentiment_frame)
         
         # News table
-        self.news_table = QTableWidget()
-        self.news_table.setColumnCount(3)
-        self.news_table.setHorizontalHeaderLabels(["Time", "Impact", "Event"])
+        self.news_model = NewsTableModel(self)
+        self.news_table = QTableView()
+        self.news_table.setModel(self.news_model)
         
         # Configure table
         header_view = self.news_table.horizontalHeader()
@@ -93,131 +248,62 @@ class NewsPanel(QFrame):
         
         layout.addWidget(self.news_table)
     
-    def update_data(self):
-        """Update panel with latest news data"""
+    def update_data(self, snapshot: Dict):
+        """Update panel from an engine snapshot"""
         try:
-            news_items = self.engine.get_news_data()
+            news_items = snapshot.get("news", ())
+            
+            # Update market sentiment
+            sentiment = snapshot.get("news_sentiment", "NEUTRAL")
+            if sentiment != self._last_sentiment:
+                self._update_sentiment(sentiment)
+                self._last_sentiment = sentiment
+            
+            # Unchanged items only need redrawing when the day rolls over (time vs date column)
+            today = datetime.now().date()
+            if news_items is self._last_news and today == self._last_news_day:
+                return
+            self._last_news, self._last_news_day = news_items, today
             
             # Update ticker text
+            ticker_text = self.ticker_text
             if news_items:
                 ticker_items = []
                 for item in news_items[:5]:  # Use top 5 for ticker
-                    impact_tag = self._get_impact_tag(item.get("impact", ""))
-                    ticker_items.append(f"[{impact_tag}] {item.get('title', '')}")
+                    tag = impact_tag(item.get("impact", ""))
+                    ticker_items.append(f"[{tag}] {item.get('title', '')}")
                 
                 self.ticker_text = " • ".join(ticker_items)
                 if len(self.ticker_text) > 500:  # Limit ticker length
                     self.ticker_text = self.ticker_text[:500] + "..."
             else:
                 self.ticker_text = "Loading news feed..."
-            
-            # Update market sentiment
-            if hasattr(self.engine.news_feed, 'get_market_sentiment'):
-                sentiment = self.engine.news_feed.get_market_sentiment()
-                self.sentiment_label.setText(sentiment)
-                
-                if sentiment == "BEARISH":
-                    self.sentiment_label.setStyleSheet("font-weight: bold; padding: 2px 8px; background-color: #F44336; color: white; border-radius: 3px;")
-                elif sentiment == "BULLISH":
-                    self.sentiment_label.setStyleSheet("font-weight: bold; padding: 2px 8px; background-color: #4CAF50; color: white; border-radius: 3px;")
-                else:
-                    self.sentiment_label.setStyleSheet("font-weight: bold; padding: 2px 8px; background-color: #455A64; color: white; border-radius: 3px;")
+            if self.ticker_text != ticker_text:
+                self.ticker.setText(self.ticker_text)
             
             # Update news table
             self._update_news_table(news_items)
             
-        except Exception as e:
-            print(f"Error updating news panel: {e}")
+        except Exception:
+            logger.exception("Error updating news panel")
+            self._last_news = self._last_sentiment = None
+    
+    def _update_sentiment(self, sentiment: str):
+        """Show and color the market sentiment"""
+        self.sentiment_label.setText(sentiment)
+        
+        if sentiment == "BEARISH":
+            self.sentiment_label.setStyleSheet("font-weight: bold; padding: 2px 8px; background-color: #F44336; color: white; border-radius: 3px;")
+        elif sentiment == "BULLISH":
+            self.sentiment_label.setStyleSheet("font-weight: bold; padding: 2px 8px; background-color: #4CAF50; color: white; border-radius: 3px;")
+        else:
+            self.sentiment_label.setStyleSheet("font-weight: bold; padding: 2px 8px; background-color: #455A64; color: white; border-radius: 3px;")
     
     def _update_news_table(self, news_items):
         """Update the news table with latest items"""
         try:
             # Limit to recent items
-            display_items = news_items[:20] if news_items else []
-            
-            self.news_table.setRowCount(len(display_items))
-            
-            for i, item in enumerate(display_items):
-                # Time
-                item_time = item.get("time", datetime.now())
-                if isinstance(item_time, datetime):
-                    time_str = item_time.strftime("%H:%M")
-                    
-                    # Show date if not today
-                    if item_time.date() != datetime.now().date():
-                        time_str = item_time.strftime("%m/%d")
-                else:
-                    time_str = "--:--"
-                
-                time_item = QTableWidgetItem(time_str)
-                time_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-                time_item.setTextAlignment(Qt.AlignCenter)
-                self.news_table.setItem(i, 0, time_item)
-                
-                # Impact
-                impact = item.get("impact", "")
-                impact_item = QTableWidgetItem(self._get_impact_tag(impact))
-                impact_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-                impact_item.setTextAlignment(Qt.AlignCenter)
-                
-                # Color code impact
-                if "High" in impact:
-                    impact_item.setForeground(QColor("#F44336"))
-                    impact_item.setBackground(QColor("#FFEBEE"))
-                elif "Medium" in impact:
-                    impact_item.setForeground(QColor("#FF9800"))
-                    impact_item.setBackground(QColor("#FFF3E0"))
-                else:
-                    impact_item.setForeground(QColor("#4CAF50"))
-                    impact_item.setBackground(QColor("#E8F5E8"))
-                
-                self.news_table.setItem(i, 1, impact_item)
-                
-                # Event title
-                title = item.get("title", "")
-                if len(title) > 60:
-                    title = title[:60] + "..."
-                
-                title_item = QTableWidgetItem(title)
-                title_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-                title_item.setToolTip(item.get("title", ""))  # Full title in tooltip
-                self.news_table.setItem(i, 2, title_item)
-                
-        except Exception as e:
-            print(f"Error updating news table: {e}")
-    
-    def _get_impact_tag(self, impact):
-        """Get short impact tag"""
-        if "High" in impact:
-            return "HIGH"
-        elif "Medium" in impact:
-            return "MED"
-        else:
-            return "LOW"
-    
-    def update_ticker(self):
-        """Update ticker animation"""
-        try:
-            if len(self.ticker_text) > 50:
-                # Animate ticker
-                display_width = 80  # Characters to show
-                
-                if self.ticker_position >= len(self.ticker_text):
-                    self.ticker_position = 0
-                
-                # Create scrolling text
-                extended_text = self.ticker_text + " • " + self.ticker_text
-                start_pos = self.ticker_position
-                end_pos = start_pos + display_width
-                
-                display_text = extended_text[start_pos:end_pos]
-                self.ticker_label.setText(display_text)
-                
-                # Advance position
-                self.ticker_position += 1
-            else:
-                # Static display for short text
-                self.ticker_label.setText(self.ticker_text)
+            self.news_model.set_items(news_items[:20] if news_items else ())
                 
-        except Exception as e:
-            print(f"Error updating ticker: {e}")
\ No newline at end of file
+        except Exception:
+            logger.exception("Error updating news table")
\ No newline at end of file
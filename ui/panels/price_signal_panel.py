@@ -2,19 +2,54 @@
 Price and Signal Panel - Main trading information display
 """
 
+import logging
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
+from typing import Dict, Optional
+import time
+
+logger = logging.getLogger(__name__)
 
 class PriceSignalPanel(QFrame):
     """Panel displaying current price and primary trading signal"""
     
+    # Stylesheets are built once; _set_style compares them by value
+    SOURCE_STYLES = {
+        "OCR": "color: #4CAF50; font-weight: bold; font-size: 9pt;",
+        "YAHOO": "color: #FFC107; font-weight: bold; font-size: 9pt;",
+    }
+    SOURCE_OFFLINE_STYLE = "color: #F44336; font-weight: bold; font-size: 9pt;"
+    
+    RSI_OVERBOUGHT_STYLE = "color: #F44336; font-weight: bold;"
+    RSI_OVERSOLD_STYLE = "color: #4CAF50; font-weight: bold;"
+    RSI_NEUTRAL_STYLE = "color: #E0E0E0;"
+    
+    # Signal label class and confidence stylesheet per bias
+    SIGNAL_STYLES = {
+        "BULLISH": ("signal-bullish", "color: #4CAF50; font-weight: bold; font-size: 11pt;"),
+        "BEARISH": ("signal-bearish", "color: #F44336; font-weight: bold; font-size: 11pt;"),
+    }
+    SIGNAL_NEUTRAL_STYLE = ("signal-neutral", "color: #E0E0E0; font-weight: bold; font-size: 11pt;")
+    
     def __init__(self, engine, config):
         super().__init__()
         self.engine = engine
         self.config = config
         
         self.setProperty("class", "panel")
+        self._last = {}  # Last text/stylesheet pushed to each label, by key
+        self._last_digits = {}  # Last shown value of each numeric label, as an int at its precision
+        self._last_bias = None
+        
+        # Renders are capped at max_redraw_rate; a burst keeps only the latest snapshot
+        self._min_interval = 1.0 / self.config.max_redraw_rate
+        self._last_paint = 0.0
+        self._pending_data: Optional[Dict] = None
+        self._paint_timer = QTimer(self)
+        self._paint_timer.setSingleShot(True)
+        self._paint_timer.timeout.connect(self._do_repaint)
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -34,7 +69,7 @@ class PriceSignalPanel(QFrame):
         
         # Source indicator
         self.source_label = QLabel("YAHOO")
-        self.source_label.setStyleSheet("color: #FFC107; font-weight: bold; font-size: 9pt;")
+        self.source_label.setStyleSheet(self.SOURCE_STYLES["YAHOO"])
         header_layout.addWidget(self.source_label)
         
         layout.addLayout(header_layout)
@@ -168,80 +203,120 @@ class PriceSignalPanel(QFrame):
         
         layout.addStretch()
     
-    def update_data(self):
-        """Update panel with latest data"""
+    def update_data(self, data: Dict):
+        """Render a snapshot now, or queue it if the last render was under a frame ago"""
+        self._pending_data = data
+        if self._paint_timer.isActive():
+            return
+        
+        wait = self._last_paint + self._min_interval - time.monotonic()
+        if wait > 0:
+            self._paint_timer.start(int(wait * 1000) + 1)
+        else:
+            self._do_repaint()
+    
+    def _do_repaint(self):
+        """Render the most recent queued snapshot"""
+        data, self._pending_data = self._pending_data, None
+        if data is None:
+            return
+        self._last_paint = time.monotonic()
+        
+        # Hold repaints until every label is set so Qt paints the panel once
+        self.setUpdatesEnabled(False)
         try:
-            data = self.engine.get_current_data()
-            
             # Update price
             price = data.get("price", 0.0)
-            self.price_label.setText(f"{price:.2f}")
+            self._set_number(self.price_label, "price", price)
             
             # Update source indicator
             source = data.get("source", "NONE")
-            self.source_label.setText(f"[{source}]")
-            
-            if source == "OCR":
-                self.source_label.setStyleSheet("color: #4CAF50; font-weight: bold; font-size: 9pt;")
-            elif source == "YAHOO":
-                self.source_label.setStyleSheet("color: #FFC107; font-weight: bold; font-size: 9pt;")
-            else:
-                self.source_label.setStyleSheet("color: #F44336; font-weight: bold; font-size: 9pt;")
+            self._set(self.source_label, "source", f"[{source}]")
+            self._set_style(self.source_label, "source", self.SOURCE_STYLES.get(source, self.SOURCE_OFFLINE_STYLE))
             
             # Update signal
-            bias = data.get("bias", "NEUTRAL")
-            confidence = data.get("confidence", 50)
-            
-            self.signal_label.setText(bias)
-            self.confidence_label.setText(f"{confidence}%")
-            
-            # Update signal styling
-            if bias == "BULLISH":
-                self.signal_label.setProperty("class", "signal-bullish")
-                self.confidence_label.setStyleSheet("color: #4CAF50; font-weight: bold; font-size: 11pt;")
-            elif bias == "BEARISH":
-                self.signal_label.setProperty("class", "signal-bearish")
-                self.confidence_label.setStyleSheet("color: #F44336; font-weight: bold; font-size: 11pt;")
-            else:
-                self.signal_label.setProperty("class", "signal-neutral")
-                self.confidence_label.setStyleSheet("color: #E0E0E0; font-weight: bold; font-size: 11pt;")
-            
-            # Force style update
-            self.signal_label.style().unpolish(self.signal_label)
-            self.signal_label.style().polish(self.signal_label)
+            self._update_signal(data.get("bias", "NEUTRAL"), data.get("confidence", 50))
             
             # Update indicators
             indicators = data.get("indicators", {})
             
-            self.ema9_label.setText(f"{indicators.get('ema9', 0):.2f}")
-            self.ema21_label.setText(f"{indicators.get('ema21', 0):.2f}")
-            self.ema50_label.setText(f"{indicators.get('ema50', 0):.2f}")
-            self.vwap_label.setText(f"{indicators.get('vwap', 0):.2f}")
-            self.rsi_label.setText(f"{indicators.get('rsi', 0):.1f}")
-            self.macd_label.setText(f"{indicators.get('macd', 0):.2f}")
+            self._set_number(self.ema9_label, "ema9", indicators.get('ema9', 0))
+            self._set_number(self.ema21_label, "ema21", indicators.get('ema21', 0))
+            self._set_number(self.ema50_label, "ema50", indicators.get('ema50', 0))
+            self._set_number(self.vwap_label, "vwap", indicators.get('vwap', 0))
+            self._set_number(self.rsi_label, "rsi", indicators.get('rsi', 0), 1)
+            self._set_number(self.macd_label, "macd", indicators.get('macd', 0))
             
             # Color code RSI
             rsi_val = indicators.get('rsi', 50)
             if rsi_val >= 70:
-                self.rsi_label.setStyleSheet("color: #F44336; font-weight: bold;")  # Overbought
+                self._set_style(self.rsi_label, "rsi", self.RSI_OVERBOUGHT_STYLE)
             elif rsi_val <= 30:
-                self.rsi_label.setStyleSheet("color: #4CAF50; font-weight: bold;")  # Oversold
-            else:
-                self.rsi_label.setStyleSheet("color: #E0E0E0;")
-            
-            # Update Opening Range
-            or_high = data.get("or_high")
-            or_low = data.get("or_low")
-            
-            if or_high is not None:
-                self.or_high_label.setText(f"{or_high:.2f}")
+                self._set_style(self.rsi_label, "rsi", self.RSI_OVERSOLD_STYLE)
             else:
-                self.or_high_label.setText("--")
+                self._set_style(self.rsi_label, "rsi", self.RSI_NEUTRAL_STYLE)
             
-            if or_low is not None:
-                self.or_low_label.setText(f"{or_low:.2f}")
-            else:
-                self.or_low_label.setText("--")
+            # Update Opening Range ("--" until it is set)
+            self._set_number(self.or_high_label, "or_high", data.get("or_high"))
+            self._set_number(self.or_low_label, "or_low", data.get("or_low"))
                 
-        except Exception as e:
-            print(f"Error updating price/signal panel: {e}")
\ No newline at end of file
+        except Exception:
+            logger.exception("Error updating price/signal panel")
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _set(self, label: QLabel, key: str, text: str):
+        """Set label text only when it differs from what was last rendered"""
+        if self._last.get(key) == text:
+            return
+        self._last[key] = text
+        label.setText(text)
+    
+    def _set_number(self, label: QLabel, key: str, value, decimals: int = 2):
+        """Set a fixed-point label, skipping the formatting when the shown digits are unchanged
+        
+        None shows as "--"; NaN and infinities are always formatted.
+        """
+        if value is None:
+            digits, text = None, "--"
+        else:
+            scale = 10 ** decimals
+            try:
+                digits = round(value * scale)
+            except (ValueError, OverflowError):
+                digits, text = None, f"{value:.{decimals}f}"
+            else:
+                if self._last_digits.get(key) == digits:
+                    return
+                text = f"{digits / scale:.{decimals}f}"
+        
+        self._last_digits[key] = digits
+        self._set(label, key, text)
+    
+    def _set_style(self, label: QLabel, key: str, style: str):
+        """Set a label stylesheet only when it changed, sparing Qt a re-polish"""
+        key += ":style"
+        if self._last.get(key) == style:
+            return
+        self._last[key] = style
+        label.setStyleSheet(style)
+    
+    def _update_signal(self, bias: str, confidence: int):
+        """Update the signal display"""
+        self._set(self.signal_label, "signal", bias)
+        self._set(self.confidence_label, "confidence", f"{confidence}%")
+        
+        # Styling only depends on the bias; repolishing walks the whole stylesheet
+        if bias == self._last_bias:
+            return
+        self._last_bias = bias
+        
+        # Update signal styling
+        signal_class, confidence_style = self.SIGNAL_STYLES.get(bias, self.SIGNAL_NEUTRAL_STYLE)
+        self.signal_label.setProperty("class", signal_class)
+        self._set_style(self.confidence_label, "confidence", confidence_style)
+        
+        # Force style update
+        style = self.signal_label.style()
+        style.unpolish(self.signal_label)
+        style.polish(self.signal_label)
\ No newline at end of file
@@ -2,25 +2,61 @@
 Signal History Panel - Shows recent signal changes and performance
 """
 
+import logging
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
+from collections import deque
 from datetime import datetime, timedelta
+from typing import Dict
+import time
+
+logger = logging.getLogger(__name__)
 
 class SignalHistoryPanel(QFrame):
     """Panel showing signal history and changes"""
     
+    MAX_HISTORY = 50
+    
+    ROW_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+    SIGNAL_COLORS = {
+        "BULLISH": QBrush(QColor("#4CAF50")),
+        "BEARISH": QBrush(QColor("#F44336")),
+    }
+    NEUTRAL_COLOR = QBrush(QColor("#E0E0E0"))
+    
     def __init__(self, engine, config):
         super().__init__()
         self.engine = engine
         self.config = config
         
         self.setProperty("class", "panel")
-        self.signal_history = []  # Store signal changes
+        self.signal_history = deque(maxlen=self.MAX_HISTORY)  # Store signal changes
         self.last_signal = None
         self.last_check_time = datetime.now()
+        self._last = {}  # Last text pushed to each stats label, by key
+        
+        # Running counts of today's signal changes
+        self._today = self.last_check_time.date()
+        self._n_today = 0
+        self._n_bull = 0
+        self._n_bear = 0
+        self._last_change_mono = 0.0  # time.monotonic() of the newest history entry
+        
+        # Renders are capped at max_redraw_rate; signal changes are still recorded every update
+        self._min_interval = 1.0 / self.config.max_redraw_rate
+        self._last_paint = 0.0
+        self._new_entries = 0  # History entries not yet in the table
+        self._paint_timer = QTimer(self)
+        self._paint_timer.setSingleShot(True)
+        self._paint_timer.timeout.connect(self._do_repaint)
         
         self.setup_ui()
+        
+        # "Last Change: Ns ago" and the day rollover move on between engine updates
+        self._stats_timer = QTimer(self)
+        self._stats_timer.timeout.connect(self._update_statistics)
+        self._stats_timer.start(1000)
     
     def setup_ui(self):
         """Setup the user interface"""
@@ -50,6 +86,16 @@ class SignalHistoryPanel(QFrame):
         self.history_table.verticalHeader().setVisible(False)
         self.history_table.setMaximumHeight(200)
         
+        # One row per history slot, reused as a ring; rows stay hidden until first written
+        self.history_table.setRowCount(self.MAX_HISTORY)
+        for row in range(self.MAX_HISTORY):
+            for column in range(4):
+                item = QTableWidgetItem()
+                item.setFlags(self.ROW_FLAGS)
+                self.history_table.setItem(row, column, item)
+            self.history_table.setRowHidden(row, True)
+        self._head = 0  # Next row to overwrite, always the oldest entry
+        
         layout.addWidget(self.history_table)
         
         # Statistics section
@@ -89,12 +135,9 @@ class SignalHistoryPanel(QFrame):
         
         layout.addStretch()
     
-    def update_data(self):
-        """Update panel with latest signal data"""
+    def update_data(self, current_data: Dict):
+        """Record any signal change, then render now or once the frame interval has passed"""
         try:
-            current_data = self.engine.get_current_data()
-            current_time = datetime.now()
-            
             current_signal = current_data.get("bias", "NEUTRAL")
             current_confidence = current_data.get("confidence", 50)
             current_reasons = current_data.get("reasons", [])
@@ -104,98 +147,132 @@ class SignalHistoryPanel(QFrame):
                 if self.last_signal is not None:  # Don't record initial state
                     # Record signal change
                     key_reason = current_reasons[0] if current_reasons else "No reason given"
+                    short_reason = key_reason[:50] + "..." if len(key_reason) > 50 else key_reason
+                    current_time = datetime.now()
+                    self._last_change_mono = time.monotonic()
                     
                     self.signal_history.append({
                         "time": current_time,
                         "signal": current_signal,
                         "confidence": current_confidence,
-                        "reason": key_reason
+                        "reason": key_reason,
+                        "reason_short": short_reason
                     })
                     
-                    # Limit history to last 50 entries
-                    if len(self.signal_history) > 50:
-                        self.signal_history = self.signal_history[-50:]
+                    self._new_entries += 1
+                    
+                    self._roll_day(current_time.date())
+                    self._n_today += 1
+                    if current_signal == "BULLISH":
+                        self._n_bull += 1
+                    elif current_signal == "BEARISH":
+                        self._n_bear += 1
                 
                 self.last_signal = current_signal
+            
+        except Exception:
+            logger.exception("Error updating signal history")
+        
+        if self._paint_timer.isActive():
+            return
+        
+        wait = self._last_paint + self._min_interval - time.monotonic()
+        if wait > 0:
+            self._paint_timer.start(int(wait * 1000) + 1)
+        else:
+            self._do_repaint()
+    
+    def _do_repaint(self):
+        """Render the history table (if it changed) and the session stats"""
+        self._last_paint = time.monotonic()
+        
+        # Hold repaints until the table and stats are set so Qt paints the panel once
+        self.setUpdatesEnabled(False)
+        try:
+            if self._new_entries:
                 self._update_history_table()
             
             self._update_statistics()
             
-        except Exception as e:
-            print(f"Error updating signal history: {e}")
+        finally:
+            self.setUpdatesEnabled(True)
     
     def _update_history_table(self):
-        """Update the history table with latest data"""
+        """Write entries added since the last render into the oldest rows and move them to the top"""
+        count = min(self._new_entries, len(self.signal_history))
+        new_entries = [self.signal_history[i] for i in range(-count, 0)]
+        self._new_entries = 0
+        
+        table = self.history_table
+        rows = table.verticalHeader()
+        table.setUpdatesEnabled(False)
         try:
-            # Clear and populate table
-            self.history_table.setRowCount(len(self.signal_history))
-            
-            for i, entry in enumerate(reversed(self.signal_history)):  # Most recent first
-                time_str = entry["time"].strftime("%H:%M:%S")
+            for entry in new_entries:
+                row = self._head
+                self._head = (row + 1) % self.MAX_HISTORY
+                
                 signal = entry["signal"]
-                confidence = f"{entry['confidence']}%"
-                reason = entry["reason"][:50] + "..." if len(entry["reason"]) > 50 else entry["reason"]
                 
                 # Time
-                time_item = QTableWidgetItem(time_str)
-                time_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-                self.history_table.setItem(i, 0, time_item)
+                table.item(row, 0).setText(entry["time"].strftime("%H:%M:%S"))
                 
                 # Signal with color coding
-                signal_item = QTableWidgetItem(signal)
-                signal_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-                
-                if signal == "BULLISH":
-                    signal_item.setForeground(QColor("#4CAF50"))
-                elif signal == "BEARISH":
-                    signal_item.setForeground(QColor("#F44336"))
-                else:
-                    signal_item.setForeground(QColor("#E0E0E0"))
-                
-                self.history_table.setItem(i, 1, signal_item)
+                signal_item = table.item(row, 1)
+                signal_item.setText(signal)
+                signal_item.setForeground(self.SIGNAL_COLORS.get(signal, self.NEUTRAL_COLOR))
                 
                 # Confidence
-                confidence_item = QTableWidgetItem(confidence)
-                confidence_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-                self.history_table.setItem(i, 2, confidence_item)
+                table.item(row, 2).setText(f"{entry['confidence']}%")
                 
                 # Reason
-                reason_item = QTableWidgetItem(reason)
-                reason_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
+                reason_item = table.item(row, 3)
+                reason_item.setText(entry["reason_short"])
                 reason_item.setToolTip(entry["reason"])  # Full reason in tooltip
-                self.history_table.setItem(i, 3, reason_item)
                 
-        except Exception as e:
-            print(f"Error updating history table: {e}")
+                # Most recent first
+                rows.moveSection(rows.visualIndex(row), 0)
+                table.setRowHidden(row, False)
+                
+        except Exception:
+            logger.exception("Error updating history table")
+        finally:
+            table.setUpdatesEnabled(True)
+    
+    def _set(self, label: QLabel, key: str, text: str):
+        """Set label text only when it differs from what was last rendered"""
+        if self._last.get(key) == text:
+            return
+        self._last[key] = text
+        label.setText(text)
+    
+    def _roll_day(self, today):
+        """Reset the running counts when the date moves on"""
+        if today != self._today:
+            self._today = today
+            self._n_today = self._n_bull = self._n_bear = 0
     
     def _update_statistics(self):
         """Update session statistics"""
         try:
             # Count signals by type (today only)
-            today = datetime.now().date()
-            today_signals = [s for s in self.signal_history if s["time"].date() == today]
-            
-            total_signals = len(today_signals)
-            bullish_count = len([s for s in today_signals if s["signal"] == "BULLISH"])
-            bearish_count = len([s for s in today_signals if s["signal"] == "BEARISH"])
+            self._roll_day(datetime.now().date())
             
-            self.signals_count_label.setText(str(total_signals))
-            self.bullish_count_label.setText(str(bullish_count))
-            self.bearish_count_label.setText(str(bearish_count))
+            self._set(self.signals_count_label, "signals", str(self._n_today))
+            self._set(self.bullish_count_label, "bullish", str(self._n_bull))
+            self._set(self.bearish_count_label, "bearish", str(self._n_bear))
             
             # Last change time
             if self.signal_history:
-                last_change = self.signal_history[-1]["time"]
-                time_diff = datetime.now() - last_change
+                elapsed = time.monotonic() - self._last_change_mono
                 
-                if time_diff.total_seconds() < 60:
-                    self.last_change_label.setText(f"{int(time_diff.total_seconds())}s ago")
-                elif time_diff.total_seconds() < 3600:
-                    self.last_change_label.setText(f"{int(time_diff.total_seconds() // 60)}m ago")
+                if elapsed < 60:
+                    self._set(self.last_change_label, "last_change", f"{int(elapsed)}s ago")
+                elif elapsed < 3600:
+                    self._set(self.last_change_label, "last_change", f"{int(elapsed // 60)}m ago")
                 else:
-                    self.last_change_label.setText(last_change.strftime("%H:%M"))
+                    self._set(self.last_change_label, "last_change", self.signal_history[-1]["time"].strftime("%H:%M"))
             else:
-                self.last_change_label.setText("--")
+                self._set(self.last_change_label, "last_change", "--")
                 
-        except Exception as e:
-            print(f"Error updating statistics: {e}")
\ No newline at end of file
+        except Exception:
+            logger.exception("Error updating statistics")
\ No newline at end of file
@@ -3,10 +3,13 @@ DOM Region Selector - Manual selection of OCR region
 """
 
 import sys
+import logging
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
 
+logger = logging.getLogger(__name__)
+
 class RegionSelector:
     """Tool for manually selecting DOM region"""
     
@@ -29,8 +32,8 @@ class RegionSelector:
             
             return self.selected_region
             
-        except Exception as e:
-            print(f"Error in region selection: {e}")
+        except Exception:
+            logger.exception("Error in region selection")
             return None
     
     def _on_region_selected(self, bbox):
@@ -56,6 +59,9 @@ class RegionOverlay(QWidget):
         
         # Styling
         self.setStyleSheet("background-color: rgba(0, 0, 0, 50);")
+        self._dim_brush = QBrush(QColor(0, 0, 0, 100))
+        self._border_pen = QPen(QColor(255, 255, 255, 200), 2, Qt.SolidLine)
+        self._text_pen = QPen(QColor(255, 255, 255), 1)
         self.setCursor(Qt.CrossCursor)
         
         # Instructions
@@ -87,8 +93,16 @@ class RegionOverlay(QWidget):
     def mouseMoveEvent(self, event):
         """Update selection"""
         if self.selecting:
+            # Only the area covered by the old or new selection changes
+            dirty = self._selection_bounds()
             self.end_pos = event.pos()
-            self.update()
+            self.update(dirty.united(self._selection_bounds()))
+    
+    def _selection_bounds(self) -> QRect:
+        """Area painted for the selection: its rectangle, border and size label"""
+        rect = QRect(self.start_pos, self.end_pos).normalized()
+        text_rect = QRect(rect.bottomLeft() + QPoint(5, 5), QSize(100, 20))
+        return rect.united(text_rect).adjusted(-2, -2, 2, 2)
     
     def mouseReleaseEvent(self, event):
         """End selection"""
@@ -134,23 +148,22 @@ class RegionOverlay(QWidget):
             # Draw selection rectangle
             rect = QRect(self.start_pos, self.end_pos).normalized()
             
-            # Semi-transparent overlay outside selection
-            overlay_brush = QBrush(QColor(0, 0, 0, 100))
-            painter.fillRect(self.rect(), overlay_brush)
-            
-            # Clear selection area
-            painter.setCompositionMode(QPainter.CompositionMode_Clear)
-            painter.fillRect(rect, QColor(0, 0, 0, 0))
+            # Semi-transparent overlay outside selection, in one pass clipped around it.
+            # The translucent window starts out cleared, so the dim color can be
+            # written straight in instead of blended.
+            painter.setClipRegion(QRegion(self.rect()).subtracted(QRegion(rect)))
+            painter.setCompositionMode(QPainter.CompositionMode_Source)
+            painter.fillRect(self.rect(), self._dim_brush)
+            painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+            painter.setClipping(False)
             
             # Draw selection border
-            painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
-            pen = QPen(QColor(255, 255, 255, 200), 2, Qt.SolidLine)
-            painter.setPen(pen)
+            painter.setPen(self._border_pen)
             painter.drawRect(rect)
             
             # Draw size info
             size_text = f"{rect.width()} x {rect.height()}"
             text_rect = QRect(rect.bottomLeft() + QPoint(5, 5), QSize(100, 20))
             
-            painter.setPen(QPen(QColor(255, 255, 255), 1))
+            painter.setPen(self._text_pen)
             painter.drawText(text_rect, Qt.AlignLeft, size_text)
\ No newline at end of file
@@ -2,9 +2,8 @@
 Bloomberg-style dark theme stylesheets
 """
 
-def get_dark_theme_stylesheet() -> str:
-    """Return the main dark theme stylesheet"""
-    return """
+# Built once at import; apply them once on a top-level widget so Qt parses them once
+DARK_THEME_STYLESHEET = """
 /* Main window and base styling */
 QMainWindow {
     background-color: #1E1E1E;
@@ -18,9 +17,12 @@ QWidget {
     font-size: 9pt;
 }
 
-/* Panel styling */
+/* Panel styling; plain QFrames and QLabels inside panels only take the background */
 QFrame {
     background-color: #2D2D2D;
+}
+
+QFrame[class="panel"] {
     border: 1px solid #404040;
     border-radius: 6px;
     padding: 8px;
@@ -81,7 +83,7 @@ QLabel[class="signal-neutral"] {
 }
 
 /* Tables */
-QTableWidget {
+QTableView {
     background-color: #252525;
     alternate-background-color: #2A2A2A;
     border: 1px solid #404040;
@@ -89,12 +91,12 @@ QTableWidget {
     border-radius: 4px;
 }
 
-QTableWidget::item {
+QTableView::item {
     padding: 6px;
     border: none;
 }
 
-QTableWidget::item:selected {
+QTableView::item:selected {
     background-color: #1976D2;
     color: #FFFFFF;
 }
@@ -262,9 +264,7 @@ QFrame[class="chart"] {
 }
 """
 
-def get_panel_stylesheet() -> str:
-    """Panel-specific styling"""
-    return """
+PANEL_STYLESHEET = """
 QFrame[class="panel"] {
     background-color: #2D2D2D;
     border: 1px solid #404040;
@@ -280,4 +280,12 @@ QFrame[class="panel-header"] {
     padding: 8px;
     margin-bottom: 8px;
 }
-"""
\ No newline at end of file
+"""
+
+def get_dark_theme_stylesheet() -> str:
+    """Return the main dark theme stylesheet"""
+    return DARK_THEME_STYLESHEET
+
+def get_panel_stylesheet() -> str:
+    """Panel-specific styling"""
+    return PANEL_STYLESHEET
\ No newline at end of file